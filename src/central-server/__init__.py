@@ -1 +1 @@
-# Servidor central P2P
+# Servidor central P2P
@@ -1 +1 @@
-# APIs del servidor central
+# APIs del servidor central
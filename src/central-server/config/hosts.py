@@ -1,36 +1,48 @@
-"""
-Configuración centralizada de mapeo de hosts para el sistema P2P
-"""
-
-import os
-from typing import Dict
-
-# Mapeo de hosts para diferentes entornos
-HOST_MAPPINGS = {
-    "development": {
-        "localhost:8001": "p2p-peer-1:8001",
-        "localhost:8002": "p2p-peer-2:8002", 
-        "localhost:8003": "p2p-peer-3:8003"
-    },
-    "production": {
-        "localhost:8001": "p2p-peer-1:8001",
-        "localhost:8002": "p2p-peer-2:8002", 
-        "localhost:8003": "p2p-peer-3:8003"
-    },
-    "docker": {
-        "localhost:8001": "p2p-peer-1:8001",
-        "localhost:8002": "p2p-peer-2:8002", 
-        "localhost:8003": "p2p-peer-3:8003"
-    }
-}
-
-def get_host_mapping() -> Dict[str, str]:
-    """Obtiene el mapeo de hosts según el entorno actual"""
-    env = os.getenv("ENVIRONMENT", "development")
-    return HOST_MAPPINGS.get(env, HOST_MAPPINGS["development"])
-
-def map_host(host: str, port: int) -> str:
-    """Mapea un host:puerto a su equivalente en Docker"""
-    host_port = f"{host}:{port}"
-    mapping = get_host_mapping()
-    return mapping.get(host_port, host_port)
+"""
+Configuración centralizada de mapeo de hosts para el sistema P2P
+"""
+
+import os
+from functools import lru_cache
+from typing import Dict
+
+# Mapeo de hosts para diferentes entornos
+HOST_MAPPINGS = {
+    "development": {
+        "localhost:8001": "p2p-peer-1:8001",
+        "localhost:8002": "p2p-peer-2:8002", 
+        "localhost:8003": "p2p-peer-3:8003"
+    },
+    "production": {
+        "localhost:8001": "p2p-peer-1:8001",
+        "localhost:8002": "p2p-peer-2:8002", 
+        "localhost:8003": "p2p-peer-3:8003"
+    },
+    "docker": {
+        "localhost:8001": "p2p-peer-1:8001",
+        "localhost:8002": "p2p-peer-2:8002", 
+        "localhost:8003": "p2p-peer-3:8003"
+    }
+}
+
+def get_host_mapping() -> Dict[str, str]:
+    """Obtiene el mapeo de hosts según el entorno actual"""
+    env = os.getenv("ENVIRONMENT", "development")
+    return HOST_MAPPINGS.get(env, HOST_MAPPINGS["development"])
+
+@lru_cache(maxsize=256)
+def map_host(host: str, port: int) -> str:
+    """Mapea un host:puerto a su equivalente en Docker (cacheado: el entorno no cambia en ejecución)"""
+    host_port = f"{host}:{port}"
+    mapping = get_host_mapping()
+    return mapping.get(host_port, host_port)
+
+@lru_cache(maxsize=256)
+def peer_base_url(host: str, port: int) -> str:
+    """URL base HTTP de un peer, ya mapeada"""
+    return f"http://{map_host(host, port)}"
+
+@lru_cache(maxsize=256)
+def peer_upload_url(host: str, port: int) -> str:
+    """URL de subida de archivos de un peer"""
+    return f"{peer_base_url(host, port)}/api/upload"
@@ -1 +1 @@
-# Modelos del servidor central
+# Modelos del servidor central
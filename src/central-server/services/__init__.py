@@ -1 +1 @@
-# Servicios del servidor central
+# Servicios del servidor central
@@ -1,320 +1,437 @@
-import asyncio
-import aiohttp
-from typing import List, Optional, Dict
-from datetime import datetime
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from models.database import File, Peer, get_db
-from models.schemas import FileInfo, SearchRequest, SearchResponse
-from services.peer_manager import PeerManager
-from config.hosts import map_host
-import logging
-
-logger = logging.getLogger(__name__)
-
-class CentralFileIndexer:
-    """Indexador central de archivos de todos los peers"""
-    
-    def __init__(self, peer_manager: PeerManager):
-        self.peer_manager = peer_manager
-        self.session = aiohttp.ClientSession()
-        self._lock = asyncio.Lock()
-    
-    async def close(self):
-        """Cierra el cliente HTTP"""
-        if self.session:
-            await self.session.close()
-    
-    async def index_peer_files(self, peer_id: str, db: Session) -> bool:
-        """Indexa archivos de un peer específico"""
-        try:
-            # Obtener información del peer
-            peer = db.query(Peer).filter(Peer.peer_id == peer_id).first()
-            if not peer or not peer.is_online:
-                logger.warning(f"Peer {peer_id} no está disponible para indexación")
-                return False
-            
-            # Obtener archivos del peer
-            # Mapear localhost a nombres de contenedores Docker
-            mapped_host = map_host(peer.host, peer.port)
-            url = f"http://{mapped_host}/api/files"
-            logger.info(f"Intentando indexar archivos del peer {peer_id} desde {url}")
-            try:
-                # Usar aiohttp para consistencia con el resto del sistema
-                import aiohttp
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url, timeout=30) as response:
-                        if response.status != 200:
-                            logger.error(f"Error obteniendo archivos del peer {peer_id}: HTTP {response.status}")
-                            return False
-                        
-                        data = await response.json()
-                        files_data = data.get('files', [])
-                        
-                        # NO eliminar archivos subidos - solo marcar como no disponibles los que no están en el directorio local
-                        # Los archivos subidos se mantienen en la BD para preservar la funcionalidad
-                        existing_files = db.query(File).filter(File.peer_id == peer_id).all()
-                        local_file_hashes = set()
-                        
-                        # Indexar nuevos archivos y actualizar existentes
-                        indexed_count = 0
-                        for file_data in files_data:
-                            try:
-                                file_hash = file_data['hash']
-                                local_file_hashes.add(file_hash)
-                                
-                                # Buscar si el archivo ya existe
-                                existing_file = db.query(File).filter(
-                                    File.file_hash == file_hash,
-                                    File.peer_id == peer_id
-                                ).first()
-                                
-                                if existing_file:
-                                    # Actualizar archivo existente - solo si no es un archivo subido
-                                    if existing_file.source != 'upload':
-                                        existing_file.filename = file_data['filename']
-                                        existing_file.size = file_data['size']
-                                        existing_file.is_available = file_data.get('is_available', True)
-                                        existing_file.last_modified = datetime.fromisoformat(file_data['last_modified'].replace('Z', '+00:00'))
-                                        existing_file.updated_at = datetime.utcnow()
-                                        logger.debug(f"Archivo {file_data['filename']} actualizado en peer {peer_id}")
-                                    else:
-                                        logger.debug(f"Archivo {file_data['filename']} es un archivo subido, no se actualiza")
-                                else:
-                                    # Crear nuevo archivo indexado
-                                    file_record = File(
-                                        filename=file_data['filename'],
-                                        file_hash=file_data['hash'],
-                                        size=file_data['size'],
-                                        peer_id=peer_id,
-                                        is_available=file_data.get('is_available', True),
-                                        source='indexed',  # Marcar como archivo indexado
-                                        last_modified=datetime.fromisoformat(file_data['last_modified'].replace('Z', '+00:00')),
-                                        created_at=datetime.utcnow()
-                                    )
-                                    db.add(file_record)
-                                    logger.debug(f"Archivo {file_data['filename']} indexado en peer {peer_id}")
-                                
-                                indexed_count += 1
-                            except Exception as e:
-                                logger.error(f"Error indexando archivo {file_data.get('filename', 'unknown')}: {e}")
-                                continue
-                        
-                        # Marcar como no disponibles los archivos que no están en el directorio local
-                        # Incluye también archivos subidos (source='upload') si ya no existen localmente
-                        for existing_file in existing_files:
-                            if existing_file.file_hash not in local_file_hashes:
-                                existing_file.is_available = False
-                                existing_file.updated_at = datetime.utcnow()
-                                logger.debug(f"Archivo {existing_file.filename} marcado como no disponible (no en directorio local)")
-                        
-                        db.commit()
-                        logger.info(f"Indexados {indexed_count} archivos del peer {peer_id}")
-                        
-            except Exception as e:
-                logger.error(f"Error conectando con peer {peer_id}: {e}")
-                return False
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error indexando archivos del peer {peer_id}: {e}")
-            db.rollback()
-            return False
-    
-    async def index_all_peers(self, db: Session) -> Dict[str, bool]:
-        """Indexa archivos de todos los peers en línea"""
-        try:
-            online_peers = await self.peer_manager.get_online_peers(db)
-            results = {}
-            
-            # Indexar cada peer concurrentemente
-            tasks = []
-            for peer_info in online_peers:
-                task = self._index_peer_async(peer_info.peer_id, db)
-                tasks.append((peer_info.peer_id, task))
-            
-            # Ejecutar todas las tareas
-            for peer_id, task in tasks:
-                try:
-                    result = await task
-                    results[peer_id] = result
-                except Exception as e:
-                    logger.error(f"Error en indexación concurrente del peer {peer_id}: {e}")
-                    results[peer_id] = False
-            
-            return results
-            
-        except Exception as e:
-            logger.error(f"Error indexando todos los peers: {e}")
-            return {}
-    
-    async def _index_peer_async(self, peer_id: str, db: Session) -> bool:
-        """Indexa un peer de forma asíncrona"""
-        return await self.index_peer_files(peer_id, db)
-    
-    async def search_files(self, search_request: SearchRequest, db: Session) -> SearchResponse:
-        """Busca archivos en el índice central"""
-        try:
-            start_time = datetime.utcnow()
-            
-            # Construir consulta
-            query = db.query(File).join(Peer)
-            
-            # Aplicar filtros
-            if search_request.filename:
-                query = query.filter(File.filename.contains(search_request.filename))
-            
-            if search_request.file_hash:
-                query = query.filter(File.file_hash == search_request.file_hash)
-            
-            if search_request.min_size:
-                query = query.filter(File.size >= search_request.min_size)
-            
-            if search_request.max_size:
-                query = query.filter(File.size <= search_request.max_size)
-            
-            if search_request.peer_id:
-                query = query.filter(File.peer_id == search_request.peer_id)
-            
-            # Solo archivos disponibles
-            query = query.filter(File.is_available == True)
-            
-            # Ejecutar consulta
-            files = query.all()
-            
-            # Convertir a FileInfo
-            file_infos = []
-            for file in files:
-                file_info = FileInfo(
-                    id=file.id,
-                    filename=file.filename,
-                    file_hash=file.file_hash,
-                    size=file.size,
-                    peer_id=file.peer_id,
-                    is_available=file.is_available,
-                    last_modified=file.last_modified
-                )
-                file_infos.append(file_info)
-            
-            # Calcular tiempo de búsqueda
-            search_time = (datetime.utcnow() - start_time).total_seconds()
-            
-            # Obtener peers que se consultaron
-            searched_peers = list(set([f.peer_id for f in files]))
-            
-            return SearchResponse(
-                files=file_infos,
-                total_found=len(file_infos),
-                search_time=search_time,
-                searched_peers=searched_peers
-            )
-            
-        except Exception as e:
-            logger.error(f"Error buscando archivos: {e}")
-            return SearchResponse(
-                files=[],
-                total_found=0,
-                search_time=0.0,
-                searched_peers=[]
-            )
-    
-    async def get_file_info(self, file_hash: str, db: Session) -> Optional[FileInfo]:
-        """Obtiene información de un archivo específico"""
-        try:
-            file = db.query(File).filter(File.file_hash == file_hash).first()
-            if not file:
-                return None
-            
-            return FileInfo(
-                id=file.id,
-                filename=file.filename,
-                file_hash=file.file_hash,
-                size=file.size,
-                peer_id=file.peer_id,
-                is_available=file.is_available,
-                last_modified=file.last_modified
-            )
-            
-        except Exception as e:
-            logger.error(f"Error obteniendo información del archivo {file_hash}: {e}")
-            return None
-    
-    async def update_file_availability(self, file_hash: str, is_available: bool, db: Session) -> bool:
-        """Actualiza la disponibilidad de un archivo"""
-        try:
-            file = db.query(File).filter(File.file_hash == file_hash).first()
-            if file:
-                file.is_available = is_available
-                file.updated_at = datetime.utcnow()
-                db.commit()
-                return True
-            return False
-            
-        except Exception as e:
-            logger.error(f"Error actualizando disponibilidad del archivo {file_hash}: {e}")
-            db.rollback()
-            return False
-    
-    async def get_peer_files(self, peer_id: str, db: Session, page: int = 1, limit: int = 50) -> List[FileInfo]:
-        """Obtiene todos los archivos de un peer específico con paginación"""
-        try:
-            # Calcular offset
-            offset = (page - 1) * limit
-            
-            # Obtener archivos con paginación
-            files = db.query(File).filter(
-                File.peer_id == peer_id,
-                File.is_available == True
-            ).offset(offset).limit(limit).all()
-            file_infos = []
-            
-            for file in files:
-                file_info = FileInfo(
-                    id=file.id,
-                    filename=file.filename,
-                    file_hash=file.file_hash,
-                    size=file.size,
-                    peer_id=file.peer_id,
-                    is_available=file.is_available,
-                    last_modified=file.last_modified
-                )
-                file_infos.append(file_info)
-            
-            return file_infos
-            
-        except Exception as e:
-            logger.error(f"Error obteniendo archivos del peer {peer_id}: {e}")
-            return []
-    
-    async def get_system_stats(self, db: Session) -> Dict[str, int]:
-        """Obtiene estadísticas del sistema"""
-        try:
-            total_peers = db.query(Peer).count()
-            online_peers = db.query(Peer).filter(Peer.is_online == True).count()
-            total_files = db.query(File).count()
-            available_files = db.query(File).filter(File.is_available == True).count()
-            
-            # Calcular tamaño total
-            total_size = db.query(File).with_entities(
-                func.sum(File.size)
-            ).filter(File.is_available == True).scalar() or 0
-            
-            return {
-                "total_peers": total_peers,
-                "online_peers": online_peers,
-                "total_files": total_files,
-                "total_size": total_size,
-                "active_transfers": 0,  # TODO: Implementar tracking de transferencias
-                "completed_transfers_today": 0  # TODO: Implementar tracking de transferencias
-            }
-            
-        except Exception as e:
-            logger.error(f"Error obteniendo estadísticas del sistema: {e}")
-            return {
-                "total_peers": 0,
-                "online_peers": 0,
-                "total_files": 0,
-                "total_size": 0,
-                "active_transfers": 0,
-                "completed_transfers_today": 0
-            }
+import asyncio
+import aiohttp
+import orjson
+from typing import List, Optional, Dict, Tuple
+from datetime import datetime
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select, update, bindparam
+from models.database import File, Peer, get_db
+from models.schemas import FileInfo, SearchRequest, SearchResponse
+from services.peer_manager import PeerManager
+from config.hosts import map_host
+from cache.redis_cache import redis_cache
+from utils.database import get_db_session
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Consulta precompilada para la búsqueda por hash, usada en rutas calientes
+_GET_FILE_BY_HASH = select(File).where(File.file_hash == bindparam('file_hash')).limit(1)
+
+def _to_file_info(file: File) -> FileInfo:
+    """Convierte una fila de File en FileInfo sin revalidar (los datos vienen de la BD)"""
+    return FileInfo.model_construct(
+        id=file.id,
+        filename=file.filename,
+        file_hash=file.file_hash,
+        size=file.size,
+        peer_id=file.peer_id,
+        is_available=file.is_available,
+        last_modified=file.last_modified
+    )
+
+class CentralFileIndexer:
+    """Indexador central de archivos de todos los peers"""
+    
+    # Máximo de peers indexados simultáneamente en index_all_peers
+    MAX_CONCURRENT_INDEXING = 10
+    # Segundos que se cachean las estadísticas del sistema
+    SYSTEM_STATS_TTL = 5
+    # Máximo de resultados por página en search_files
+    MAX_SEARCH_LIMIT = 500
+    # Máximo de parámetros en una cláusula IN (límite clásico de SQLite: 999)
+    MAX_IN_PARAMS = 900
+    
+    def __init__(self, peer_manager: PeerManager):
+        self.peer_manager = peer_manager
+        self.session = aiohttp.ClientSession()
+        self._lock = asyncio.Lock()
+        # Último ETag del catálogo indexado por peer; se olvida cuando el servidor
+        # modifica las filas del peer por su cuenta, para que la próxima pasada las reconcilie
+        self._etag_cache: Dict[str, str] = {}
+        peer_manager.add_offline_listener(self.invalidate_etag)
+        # Indexación en curso por peer y si es forzada
+        self._indexing: Dict[str, Tuple[asyncio.Task, bool]] = {}
+    
+    async def close(self):
+        """Cierra el cliente HTTP"""
+        if self.session:
+            await self.session.close()
+    
+    def invalidate_etag(self, peer_id: str):
+        """Fuerza que la próxima indexación del peer descargue el catálogo completo"""
+        self._etag_cache.pop(peer_id, None)
+    
+    async def index_peer_files(self, peer_id: str, force: bool = False) -> bool:
+        """Indexa archivos de un peer específico (force ignora el ETag guardado)"""
+        # Una sola indexación en curso por peer; las llamadas concurrentes esperan su resultado.
+        # Una llamada forzada no se conforma con una pasada sin forzar: se encola tras ella
+        running = self._indexing.get(peer_id)
+        if running is not None and (running[1] or not force):
+            task = running[0]
+        else:
+            previous = running[0] if running is not None else None
+            task = asyncio.create_task(self._run_indexing(peer_id, force, previous))
+            self._indexing[peer_id] = (task, force)
+            task.add_done_callback(lambda done: self._indexing_done(peer_id, done))
+        return await asyncio.shield(task)
+    
+    def _indexing_done(self, peer_id: str, task: asyncio.Task):
+        """Olvida la indexación terminada si sigue siendo la registrada para el peer"""
+        running = self._indexing.get(peer_id)
+        if running is not None and running[0] is task:
+            del self._indexing[peer_id]
+    
+    async def _run_indexing(self, peer_id: str, force: bool, previous: Optional[asyncio.Task]) -> bool:
+        """Ejecuta una indexación con su propia sesión de BD, tras la pasada previa si la hay"""
+        if previous is not None:
+            await asyncio.wait([previous])
+        # La tarea puede sobrevivir a la petición que la inició: no usar la sesión de esa petición
+        async with get_db_session() as db:
+            return await self._index_peer_files(peer_id, db, force)
+    
+    async def _index_peer_files(self, peer_id: str, db: Session, force: bool) -> bool:
+        """Descarga el catálogo de un peer y lo sincroniza con la BD"""
+        try:
+            # Obtener información del peer
+            peer = db.query(Peer).filter(Peer.peer_id == peer_id).first()
+            if not peer or not peer.is_online:
+                logger.warning(f"Peer {peer_id} no está disponible para indexación")
+                return False
+            
+            # Obtener archivos del peer
+            # Mapear localhost a nombres de contenedores Docker
+            mapped_host = map_host(peer.host, peer.port)
+            url = f"http://{mapped_host}/api/files"
+            logger.info(f"Intentando indexar archivos del peer {peer_id} desde {url}")
+            try:
+                # Pedir el catálogo solo si cambió desde la última indexación
+                headers = {}
+                cached_etag = self._etag_cache.get(peer_id)
+                if cached_etag and not force:
+                    headers['If-None-Match'] = cached_etag
+                
+                # Reutilizar la sesión compartida para aprovechar el pool de conexiones
+                async with self.session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                    if response.status == 304:
+                        logger.info(f"Catálogo del peer {peer_id} sin cambios, se omite la indexación")
+                        return True
+                    
+                    if response.status != 200:
+                        logger.error(f"Error obteniendo archivos del peer {peer_id}: HTTP {response.status}")
+                        return False
+                    
+                    # Parsear el catálogo con orjson fuera del event loop
+                    raw = await response.read()
+                    data = await asyncio.get_running_loop().run_in_executor(None, orjson.loads, raw)
+                    files_data = data.get('files', [])
+                    
+                    # NO eliminar archivos subidos - solo marcar como no disponibles los que no están en el directorio local
+                    # Los archivos subidos se mantienen en la BD para preservar la funcionalidad
+                    existing_files = db.query(File).filter(File.peer_id == peer_id).all()
+                    existing_by_hash = {f.file_hash: f for f in existing_files}
+                    local_file_hashes = set()
+                    now = datetime.utcnow()
+                    
+                    # Acumular inserciones y actualizaciones como diccionarios para aplicarlas en lote
+                    inserts = []
+                    updates = []
+                    indexed_count = 0
+                    for file_data in files_data:
+                        try:
+                            file_hash = file_data['hash']
+                            if file_hash in local_file_hashes:
+                                continue
+                            local_file_hashes.add(file_hash)
+                            last_modified = datetime.fromisoformat(file_data['last_modified'].replace('Z', '+00:00'))
+                            
+                            # Buscar si el archivo ya existe (sin consultar la BD por cada archivo)
+                            existing_file = existing_by_hash.get(file_hash)
+                            
+                            if existing_file:
+                                # Actualizar archivo existente - solo si no es un archivo subido
+                                if existing_file.source != 'upload':
+                                    updates.append({
+                                        'id': existing_file.id,
+                                        'filename': file_data['filename'],
+                                        'size': file_data['size'],
+                                        'is_available': file_data.get('is_available', True),
+                                        'last_modified': last_modified,
+                                        'updated_at': now
+                                    })
+                                    logger.debug(f"Archivo {file_data['filename']} actualizado en peer {peer_id}")
+                                else:
+                                    logger.debug(f"Archivo {file_data['filename']} es un archivo subido, no se actualiza")
+                            else:
+                                # Crear nuevo archivo indexado
+                                inserts.append({
+                                    'filename': file_data['filename'],
+                                    'file_hash': file_hash,
+                                    'size': file_data['size'],
+                                    'peer_id': peer_id,
+                                    'is_available': file_data.get('is_available', True),
+                                    'source': 'indexed',  # Marcar como archivo indexado
+                                    'last_modified': last_modified,
+                                    'created_at': now,
+                                    'updated_at': now
+                                })
+                                logger.debug(f"Archivo {file_data['filename']} indexado en peer {peer_id}")
+                            
+                            indexed_count += 1
+                        except Exception as e:
+                            logger.error(f"Error indexando archivo {file_data.get('filename', 'unknown')}: {e}")
+                            continue
+                    
+                    # Aplicar cambios sin el seguimiento del unit-of-work por fila
+                    if inserts:
+                        db.bulk_insert_mappings(File, inserts)
+                    if updates:
+                        db.bulk_update_mappings(File, updates)
+                    
+                    # Marcar como no disponibles los archivos que no están en el directorio local
+                    # Incluye también archivos subidos (source='upload') si ya no existen localmente
+                    self._mark_missing_unavailable(db, peer_id, existing_files, local_file_hashes, now)
+                    
+                    db.commit()
+                    logger.info(f"Indexados {indexed_count} archivos del peer {peer_id}")
+                    
+                    etag = response.headers.get('ETag')
+                    if etag:
+                        self._etag_cache[peer_id] = etag
+                    else:
+                        self._etag_cache.pop(peer_id, None)
+                    
+            except Exception as e:
+                logger.error(f"Error conectando con peer {peer_id}: {e}")
+                return False
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error indexando archivos del peer {peer_id}: {e}")
+            db.rollback()
+            return False
+    
+    def _mark_missing_unavailable(self, db: Session, peer_id: str, existing_files: List[File],
+                                  local_file_hashes: set, now: datetime):
+        """Marca como no disponibles los archivos del peer que ya no reporta"""
+        if len(local_file_hashes) <= self.MAX_IN_PARAMS:
+            # Una sola sentencia sobre el conjunto negativo
+            db.execute(
+                update(File)
+                .where(File.peer_id == peer_id, File.file_hash.not_in(local_file_hashes))
+                .values(is_available=False, updated_at=now)
+                .execution_options(synchronize_session=False)
+            )
+            return
+        
+        # Catálogos grandes: evitar listas NOT IN enormes actualizando por id en bloques
+        missing_ids = [f.id for f in existing_files if f.file_hash not in local_file_hashes]
+        for i in range(0, len(missing_ids), self.MAX_IN_PARAMS):
+            db.execute(
+                update(File)
+                .where(File.id.in_(missing_ids[i:i + self.MAX_IN_PARAMS]))
+                .values(is_available=False, updated_at=now)
+                .execution_options(synchronize_session=False)
+            )
+    
+    async def index_all_peers(self, db: Session) -> Dict[str, bool]:
+        """Indexa archivos de todos los peers en línea"""
+        try:
+            online_peers = await self.peer_manager.get_online_peers(db)
+            peer_ids = [peer_info.peer_id for peer_info in online_peers]
+            
+            # Indexar cada peer concurrentemente, limitando las peticiones simultáneas
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_INDEXING)
+            tasks = [
+                asyncio.create_task(self._index_peer_async(semaphore, peer_id))
+                for peer_id in peer_ids
+            ]
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            results = {}
+            for peer_id, outcome in zip(peer_ids, outcomes):
+                if isinstance(outcome, Exception):
+                    logger.error(f"Error en indexación concurrente del peer {peer_id}: {outcome}")
+                    results[peer_id] = False
+                else:
+                    results[peer_id] = outcome
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error indexando todos los peers: {e}")
+            return {}
+    
+    async def _index_peer_async(self, semaphore: asyncio.Semaphore, peer_id: str) -> bool:
+        """Indexa un peer de forma asíncrona respetando el límite de concurrencia"""
+        async with semaphore:
+            return await self.index_peer_files(peer_id)
+    
+    async def search_files(self, search_request: SearchRequest, db: Session) -> SearchResponse:
+        """Busca archivos en el índice central"""
+        try:
+            start_time = datetime.utcnow()
+            
+            # Construir consulta
+            query = db.query(File).join(Peer)
+            
+            # Aplicar filtros
+            if search_request.filename:
+                if search_request.prefix:
+                    # Rango sobre el índice de filename en lugar de LIKE '%x%'
+                    query = query.filter(
+                        File.filename >= search_request.filename,
+                        File.filename < search_request.filename + '\uffff'
+                    )
+                else:
+                    query = query.filter(File.filename.contains(search_request.filename))
+            
+            if search_request.file_hash:
+                query = query.filter(File.file_hash == search_request.file_hash)
+            
+            if search_request.min_size:
+                query = query.filter(File.size >= search_request.min_size)
+            
+            if search_request.max_size:
+                query = query.filter(File.size <= search_request.max_size)
+            
+            if search_request.peer_id:
+                query = query.filter(File.peer_id == search_request.peer_id)
+            
+            # Solo archivos disponibles
+            query = query.filter(File.is_available == True)
+            
+            # Al paginar, total y peers se calculan en la BD sobre todo el resultado
+            limit = None
+            all_peers = None
+            if search_request.limit is not None:
+                limit = min(max(search_request.limit, 1), self.MAX_SEARCH_LIMIT)
+                total_found = await asyncio.to_thread(query.with_entities(func.count(File.id)).scalar)
+                all_peers = await asyncio.to_thread(query.with_entities(File.peer_id).distinct().all)
+            
+            # Paginación por cursor (keyset) en lugar de OFFSET
+            if search_request.cursor is not None:
+                query = query.filter(File.id > search_request.cursor)
+            query = query.order_by(File.id)
+            if limit is not None:
+                query = query.limit(limit)
+            
+            # Ejecutar consulta en un hilo para no bloquear el event loop
+            files = await asyncio.to_thread(query.all)
+            
+            # Convertir a FileInfo
+            file_infos = [_to_file_info(file) for file in files]
+            
+            # Calcular tiempo de búsqueda
+            search_time = (datetime.utcnow() - start_time).total_seconds()
+            
+            # Obtener peers que se consultaron
+            if all_peers is not None:
+                searched_peers = [row[0] for row in all_peers]
+            else:
+                total_found = len(file_infos)
+                searched_peers = list(dict.fromkeys(f.peer_id for f in files))
+            
+            return SearchResponse(
+                files=file_infos,
+                total_found=total_found,
+                search_time=search_time,
+                searched_peers=searched_peers,
+                next_cursor=files[-1].id if limit is not None and len(files) == limit else None
+            )
+            
+        except Exception as e:
+            logger.error(f"Error buscando archivos: {e}")
+            return SearchResponse(
+                files=[],
+                total_found=0,
+                search_time=0.0,
+                searched_peers=[]
+            )
+    
+    async def get_file_info(self, file_hash: str, db: Session) -> Optional[FileInfo]:
+        """Obtiene información de un archivo específico"""
+        try:
+            file = db.execute(_GET_FILE_BY_HASH, {'file_hash': file_hash}).scalars().first()
+            if not file:
+                return None
+            
+            return _to_file_info(file)
+            
+        except Exception as e:
+            logger.error(f"Error obteniendo información del archivo {file_hash}: {e}")
+            return None
+    
+    async def update_file_availability(self, file_hash: str, is_available: bool, db: Session) -> bool:
+        """Actualiza la disponibilidad de un archivo"""
+        try:
+            file = db.execute(_GET_FILE_BY_HASH, {'file_hash': file_hash}).scalars().first()
+            if file:
+                file.is_available = is_available
+                file.updated_at = datetime.utcnow()
+                db.commit()
+                self.invalidate_etag(file.peer_id)
+                return True
+            return False
+            
+        except Exception as e:
+            logger.error(f"Error actualizando disponibilidad del archivo {file_hash}: {e}")
+            db.rollback()
+            return False
+    
+    async def get_peer_files(self, peer_id: str, db: Session, page: int = 1, limit: int = 50) -> List[FileInfo]:
+        """Obtiene todos los archivos de un peer específico con paginación"""
+        try:
+            # Calcular offset
+            offset = (page - 1) * limit
+            
+            # Obtener archivos con paginación
+            files = await asyncio.to_thread(db.query(File).filter(
+                File.peer_id == peer_id,
+                File.is_available == True
+            ).offset(offset).limit(limit).all)
+            return [_to_file_info(file) for file in files]
+            
+        except Exception as e:
+            logger.error(f"Error obteniendo archivos del peer {peer_id}: {e}")
+            return []
+    
+    async def get_system_stats(self, db: Session) -> Dict[str, int]:
+        """Obtiene estadísticas del sistema"""
+        try:
+            # Cachear brevemente: el dashboard consulta este endpoint con frecuencia
+            return await redis_cache.get_or_set(
+                "system_stats",
+                lambda: asyncio.to_thread(self._compute_system_stats, db),
+                ttl_seconds=self.SYSTEM_STATS_TTL
+            )
+            
+        except Exception as e:
+            logger.error(f"Error obteniendo estadísticas del sistema: {e}")
+            return {
+                "total_peers": 0,
+                "online_peers": 0,
+                "total_files": 0,
+                "total_size": 0,
+                "active_transfers": 0,
+                "completed_transfers_today": 0
+            }
+    
+    def _compute_system_stats(self, db: Session) -> Dict[str, int]:
+        """Calcula todas las estadísticas agregadas en una sola consulta"""
+        row = db.execute(select(
+            select(func.count(Peer.id)).scalar_subquery(),
+            select(func.count(Peer.id)).where(Peer.is_online == True).scalar_subquery(),
+            select(func.count(File.id)).scalar_subquery(),
+            select(func.coalesce(func.sum(File.size), 0)).where(File.is_available == True).scalar_subquery()
+        )).one()
+        total_peers, online_peers, total_files, total_size = row
+        
+        return {
+            "total_peers": total_peers,
+            "online_peers": online_peers,
+            "total_files": total_files,
+            "total_size": total_size or 0,
+            "active_transfers": 0,  # TODO: Implementar tracking de transferencias
+            "completed_transfers_today": 0  # TODO: Implementar tracking de transferencias
+        }
@@ -0,0 +1,148 @@
+import asyncio
+import errno
+import os
+import shutil
+import aiohttp
+from config.settings import settings
+from utils.cleanup import safe_remove_file
+from utils.file_validation import validate_filename
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type, before_sleep_log
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Intentos de subida HTTP a un peer antes de marcar la transferencia como fallida
+UPLOAD_MAX_ATTEMPTS = 3
+
+class PeerUploadError(Exception):
+    """El peer respondió a la subida con un estado distinto de 200"""
+    pass
+
+class PeerTransport:
+    """Punto único de envío de archivos a los peers: HTTP sobre la sesión compartida o copia al volumen"""
+    
+    # Máximo de 'docker cp' ejecutándose a la vez
+    DOCKER_COPY_CONCURRENCY = 4
+    # Tiempo máximo de una copia con 'docker cp' (segundos)
+    DOCKER_COPY_TIMEOUT = 30
+    # Mapeo de peer_id a nombre de contenedor Docker
+    CONTAINER_MAPPING = {
+        "peer1": "p2p-peer-1",
+        "peer2": "p2p-peer-2",
+        "peer3": "p2p-peer-3"
+    }
+    
+    def __init__(self, session: aiohttp.ClientSession):
+        # Sesión HTTP compartida con el resto del gestor de transferencias (un solo pool keep-alive)
+        self._session = session
+        self._docker_sem = asyncio.Semaphore(self.DOCKER_COPY_CONCURRENCY)
+    
+    @retry(
+        stop=stop_after_attempt(UPLOAD_MAX_ATTEMPTS),
+        wait=wait_exponential(multiplier=1),
+        retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError, PeerUploadError)),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True
+    )
+    async def http_upload(self, upload_url: str, file_path: str, filename: str) -> dict:
+        """Envía un archivo al peer con multipart/form-data, reintentando con backoff exponencial"""
+        logger.info(f"Subiendo {filename} a {upload_url}")
+        
+        # El formulario se reconstruye en cada intento: aiohttp consume el archivo al enviarlo.
+        # Abrir y cerrar el archivo en un hilo para no bloquear el event loop
+        f = await asyncio.to_thread(open, file_path, 'rb')
+        try:
+            form = aiohttp.FormData()
+            form.add_field('file', f, filename=filename, content_type='application/octet-stream')
+            async with self._session.post(
+                upload_url,
+                data=form,
+                timeout=aiohttp.ClientTimeout(total=60)
+            ) as response:
+                if response.status != 200:
+                    raise PeerUploadError(f"Error del peer: {response.status} - {await response.text()}")
+                return await response.json()
+        finally:
+            await asyncio.to_thread(f.close)
+    
+    async def volume_copy(self, peer_id: str, file_path: str, filename: str):
+        """Deja el archivo en el volumen compartido del peer, moviéndolo si está montado o con docker cp"""
+        # Solo el nombre base: una ruta con '../' no debe salir del volumen del peer
+        filename = os.path.basename(filename)
+        if not validate_filename(filename):
+            raise Exception(f"Nombre de archivo no válido: {filename}")
+        
+        # Si el volumen del peer está montado en este host, basta con mover el archivo
+        moved = await asyncio.to_thread(self._move_to_peer_volume, peer_id, file_path, filename)
+        if moved:
+            return
+        
+        container_name = self.CONTAINER_MAPPING.get(peer_id)
+        if not container_name:
+            raise Exception(f"No se encontró contenedor para peer {peer_id}")
+        
+        async with self._docker_sem:
+            await self._docker_copy(file_path, container_name, f"/app/shared_files/{filename}")
+    
+    def _move_to_peer_volume(self, peer_id: str, file_path: str, filename: str) -> bool:
+        """Mueve el archivo al volumen compartido del peer si está montado en este host"""
+        volume_dir = settings.PEER_VOLUME_MAP.get(peer_id)
+        if not volume_dir:
+            return False
+        
+        dest_path = os.path.join(volume_dir, filename)
+        try:
+            try:
+                # Mismo sistema de archivos: renombrado O(1), sin copiar bytes
+                os.replace(file_path, dest_path)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # Otro sistema de archivos: copia dentro del kernel (shutil usa sendfile en Linux)
+                # a un archivo parcial que se renombra al terminar, para no exponer copias a medias
+                partial_path = dest_path + ".part"
+                try:
+                    shutil.copyfile(file_path, partial_path)
+                    os.replace(partial_path, dest_path)
+                except OSError:
+                    # No dejar el parcial en el volumen: el peer lo indexaría como un archivo real
+                    safe_remove_file(partial_path)
+                    raise
+        except OSError as e:
+            logger.warning(f"No se pudo mover {file_path} al volumen de {peer_id}: {e}")
+            return False
+        
+        logger.info(f"Archivo movido al volumen del peer {peer_id}: {dest_path}")
+        return True
+    
+    async def _docker_copy(self, file_path: str, container_name: str, dest_path: str):
+        """Copia un archivo al contenedor de un peer con docker cp"""
+        # Comando Docker para copiar archivo
+        cmd = [
+            "docker", "cp",
+            file_path,
+            f"{container_name}:{dest_path}"
+        ]
+        
+        logger.info(f"Ejecutando comando: {' '.join(cmd)}")
+        
+        # Ejecutar comando como subproceso asíncrono para no bloquear el event loop;
+        # solo se captura stderr, que es lo único que se usa en caso de error
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            _, stderr = await asyncio.wait_for(proc.communicate(), timeout=self.DOCKER_COPY_TIMEOUT)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise Exception(f"Timeout copiando archivo al contenedor {container_name}")
+        
+        if proc.returncode != 0:
+            error_text = stderr.decode(errors='replace')
+            logger.error(f"Error copiando archivo: {proc.returncode} - {error_text}")
+            raise Exception(f"Error copiando archivo: {proc.returncode} - {error_text}")
+        
+        logger.info(f"Archivo copiado exitosamente al contenedor {container_name}")
@@ -1,235 +1,455 @@
-"""
-Gestor de reconexión automática para peers
-"""
-
-import asyncio
-import logging
-from typing import Dict, List, Optional, Callable
-from datetime import datetime, timedelta
-from dataclasses import dataclass
-from enum import Enum
-
-logger = logging.getLogger(__name__)
-
-class ConnectionStatus(Enum):
-    """Estados de conexión de un peer"""
-    CONNECTED = "connected"
-    DISCONNECTED = "disconnected"
-    RECONNECTING = "reconnecting"
-    FAILED = "failed"
-
-@dataclass
-class PeerConnectionInfo:
-    """Información de conexión de un peer"""
-    peer_id: str
-    host: str
-    port: int
-    status: ConnectionStatus
-    last_seen: datetime
-    reconnect_attempts: int = 0
-    max_reconnect_attempts: int = 5
-    reconnect_interval: int = 30  # segundos
-    next_reconnect: Optional[datetime] = None
-
-class ReconnectionManager:
-    """Gestor de reconexión automática para peers"""
-    
-    def __init__(self):
-        self.peer_connections: Dict[str, PeerConnectionInfo] = {}
-        self.reconnect_callbacks: List[Callable] = []
-        self.status_callbacks: List[Callable] = []
-        self._running = False
-        self._task: Optional[asyncio.Task] = None
-        self._lock = asyncio.Lock()
-    
-    async def start(self):
-        """Inicia el gestor de reconexión"""
-        if self._running:
-            return
-        
-        self._running = True
-        self._task = asyncio.create_task(self._reconnection_loop())
-        logger.info("Gestor de reconexión iniciado")
-    
-    async def stop(self):
-        """Detiene el gestor de reconexión"""
-        self._running = False
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
-        logger.info("Gestor de reconexión detenido")
-    
-    async def register_peer(self, peer_id: str, host: str, port: int, 
-                           max_attempts: int = 5, interval: int = 30):
-        """Registra un peer para monitoreo de reconexión"""
-        async with self._lock:
-            self.peer_connections[peer_id] = PeerConnectionInfo(
-                peer_id=peer_id,
-                host=host,
-                port=port,
-                status=ConnectionStatus.CONNECTED,
-                last_seen=datetime.utcnow(),
-                max_reconnect_attempts=max_attempts,
-                reconnect_interval=interval
-            )
-            logger.info(f"Peer {peer_id} registrado para reconexión")
-    
-    async def unregister_peer(self, peer_id: str):
-        """Desregistra un peer del monitoreo"""
-        async with self._lock:
-            if peer_id in self.peer_connections:
-                del self.peer_connections[peer_id]
-                logger.info(f"Peer {peer_id} desregistrado del monitoreo")
-    
-    async def update_peer_status(self, peer_id: str, is_online: bool):
-        """Actualiza el estado de conexión de un peer"""
-        async with self._lock:
-            if peer_id not in self.peer_connections:
-                return
-            
-            peer_info = self.peer_connections[peer_id]
-            
-            if is_online:
-                if peer_info.status != ConnectionStatus.CONNECTED:
-                    logger.info(f"Peer {peer_id} se reconectó exitosamente")
-                    peer_info.status = ConnectionStatus.CONNECTED
-                    peer_info.reconnect_attempts = 0
-                    peer_info.next_reconnect = None
-                    await self._notify_status_change(peer_id, ConnectionStatus.CONNECTED)
-            else:
-                if peer_info.status == ConnectionStatus.CONNECTED:
-                    logger.warning(f"Peer {peer_id} se desconectó")
-                    peer_info.status = ConnectionStatus.DISCONNECTED
-                    peer_info.next_reconnect = datetime.utcnow() + timedelta(seconds=peer_info.reconnect_interval)
-                    await self._notify_status_change(peer_id, ConnectionStatus.DISCONNECTED)
-            
-            peer_info.last_seen = datetime.utcnow()
-    
-    async def _reconnection_loop(self):
-        """Loop principal de reconexión"""
-        while self._running:
-            try:
-                await self._check_reconnections()
-                await asyncio.sleep(10)  # Verificar cada 10 segundos
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error en loop de reconexión: {e}")
-                await asyncio.sleep(30)  # Esperar más tiempo en caso de error
-    
-    async def _check_reconnections(self):
-        """Verifica qué peers necesitan reconexión"""
-        current_time = datetime.utcnow()
-        peers_to_reconnect = []
-        
-        async with self._lock:
-            for peer_id, peer_info in self.peer_connections.items():
-                if (peer_info.status == ConnectionStatus.DISCONNECTED and 
-                    peer_info.next_reconnect and 
-                    current_time >= peer_info.next_reconnect and
-                    peer_info.reconnect_attempts < peer_info.max_reconnect_attempts):
-                    peers_to_reconnect.append(peer_id)
-        
-        # Procesar reconexiones
-        for peer_id in peers_to_reconnect:
-            await self._attempt_reconnection(peer_id)
-    
-    async def _attempt_reconnection(self, peer_id: str):
-        """Intenta reconectar un peer"""
-        async with self._lock:
-            if peer_id not in self.peer_connections:
-                return
-            
-            peer_info = self.peer_connections[peer_id]
-            peer_info.status = ConnectionStatus.RECONNECTING
-            peer_info.reconnect_attempts += 1
-        
-        logger.info(f"Intentando reconectar peer {peer_id} (intento {peer_info.reconnect_attempts})")
-        
-        try:
-            # Notificar que se está intentando reconectar
-            await self._notify_status_change(peer_id, ConnectionStatus.RECONNECTING)
-            
-            # Ejecutar callbacks de reconexión
-            for callback in self.reconnect_callbacks:
-                try:
-                    await callback(peer_id, peer_info.host, peer_info.port)
-                except Exception as e:
-                    logger.error(f"Error en callback de reconexión: {e}")
-            
-            # Simular verificación de conexión (en implementación real, harías ping)
-            await asyncio.sleep(2)
-            
-            # Por ahora, asumimos que la reconexión fue exitosa
-            # En implementación real, verificarías la conexión
-            async with self._lock:
-                peer_info.status = ConnectionStatus.CONNECTED
-                peer_info.reconnect_attempts = 0
-                peer_info.next_reconnect = None
-            
-            logger.info(f"Peer {peer_id} reconectado exitosamente")
-            await self._notify_status_change(peer_id, ConnectionStatus.CONNECTED)
-            
-        except Exception as e:
-            logger.error(f"Error reconectando peer {peer_id}: {e}")
-            
-            async with self._lock:
-                peer_info.status = ConnectionStatus.DISCONNECTED
-                peer_info.next_reconnect = datetime.utcnow() + timedelta(seconds=peer_info.reconnect_interval)
-            
-            # Si se agotaron los intentos, marcar como fallido
-            if peer_info.reconnect_attempts >= peer_info.max_reconnect_attempts:
-                peer_info.status = ConnectionStatus.FAILED
-                logger.error(f"Peer {peer_id} falló después de {peer_info.max_reconnect_attempts} intentos")
-                await self._notify_status_change(peer_id, ConnectionStatus.FAILED)
-    
-    async def _notify_status_change(self, peer_id: str, status: ConnectionStatus):
-        """Notifica cambios de estado"""
-        for callback in self.status_callbacks:
-            try:
-                await callback(peer_id, status)
-            except Exception as e:
-                logger.error(f"Error en callback de estado: {e}")
-    
-    def add_reconnect_callback(self, callback: Callable):
-        """Agrega un callback para reconexión"""
-        self.reconnect_callbacks.append(callback)
-    
-    def add_status_callback(self, callback: Callable):
-        """Agrega un callback para cambios de estado"""
-        self.status_callbacks.append(callback)
-    
-    async def get_peer_status(self, peer_id: str) -> Optional[ConnectionStatus]:
-        """Obtiene el estado de un peer"""
-        async with self._lock:
-            if peer_id in self.peer_connections:
-                return self.peer_connections[peer_id].status
-            return None
-    
-    async def get_all_peer_statuses(self) -> Dict[str, ConnectionStatus]:
-        """Obtiene el estado de todos los peers"""
-        async with self._lock:
-            return {peer_id: info.status for peer_id, info in self.peer_connections.items()}
-    
-    async def get_disconnected_peers(self) -> List[str]:
-        """Obtiene lista de peers desconectados"""
-        async with self._lock:
-            return [
-                peer_id for peer_id, info in self.peer_connections.items()
-                if info.status in [ConnectionStatus.DISCONNECTED, ConnectionStatus.RECONNECTING, ConnectionStatus.FAILED]
-            ]
-    
-    async def reset_peer_attempts(self, peer_id: str):
-        """Reinicia los intentos de reconexión de un peer"""
-        async with self._lock:
-            if peer_id in self.peer_connections:
-                peer_info = self.peer_connections[peer_id]
-                peer_info.reconnect_attempts = 0
-                peer_info.next_reconnect = None
-                logger.info(f"Intentos de reconexión reiniciados para peer {peer_id}")
-
-# Instancia global del gestor de reconexión
-reconnection_manager = ReconnectionManager()
+"""
+Gestor de reconexión automática para peers
+"""
+
+import asyncio
+import heapq
+import logging
+import random
+from types import MappingProxyType
+from typing import Dict, List, Optional, Callable, Tuple, Set, Mapping
+from datetime import datetime
+from dataclasses import dataclass, field
+from enum import Enum
+from config.hosts import map_host
+
+logger = logging.getLogger(__name__)
+
+def _now() -> float:
+    """Reloj monotónico del event loop, usado para programar reconexiones"""
+    return asyncio.get_running_loop().time()
+
+class ConnectionStatus(Enum):
+    """Estados de conexión de un peer"""
+    CONNECTED = "connected"
+    DISCONNECTED = "disconnected"
+    RECONNECTING = "reconnecting"
+    FAILED = "failed"
+
+# Estados considerados "no en línea"; conjunto constante para pertenencia O(1) sin asignaciones
+_NOT_ONLINE = frozenset({
+    ConnectionStatus.DISCONNECTED,
+    ConnectionStatus.RECONNECTING,
+    ConnectionStatus.FAILED,
+})
+
+@dataclass(slots=True)
+class PeerConnectionInfo:
+    """Información de conexión de un peer"""
+    peer_id: str
+    host: str
+    port: int
+    status: ConnectionStatus
+    last_seen: datetime
+    reconnect_attempts: int = 0
+    max_reconnect_attempts: int = 5
+    reconnect_interval: int = 30  # segundos
+    next_reconnect: Optional[float] = None  # reloj monotónico del event loop (_now)
+    # Lock propio del peer: serializa solo las transiciones de este peer
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False, compare=False)
+    # Último estado observado pendiente de aplicar y temporizador del debounce
+    _pending_online: Optional[bool] = field(default=None, repr=False, compare=False)
+    _pending_handle: Optional[asyncio.TimerHandle] = field(default=None, repr=False, compare=False)
+
+class ReconnectionManager:
+    """Gestor de reconexión automática para peers"""
+    
+    # Límite del backoff exponencial y jitter máximo (segundos)
+    MAX_RECONNECT_DELAY = 300
+    RECONNECT_JITTER = 5
+    # Máximo de intentos de reconexión simultáneos
+    MAX_CONCURRENT_RECONNECTS = 32
+    # Ventana para agrupar notificaciones de estado (segundos)
+    NOTIFY_COALESCE_WINDOW = 0.05
+    # Timeout de la verificación de conexión al reconectar (segundos)
+    CONNECTION_TIMEOUT = 5
+    # Ventana de debounce para peers que oscilan entre online y offline (segundos)
+    STATUS_DEBOUNCE = 0.5
+    
+    def __init__(self, callback_timeout: float = 5):
+        self.peer_connections: Dict[str, PeerConnectionInfo] = {}
+        # Tuplas inmutables: agregar reemplaza la referencia y la iteración no necesita lock
+        self.reconnect_callbacks: Tuple[Callable, ...] = ()
+        self.status_callbacks: Tuple[Callable, ...] = ()
+        self.status_batch_callbacks: Tuple[Callable, ...] = ()
+        # Tiempo máximo de ejecución de cada callback (segundos)
+        self.callback_timeout = callback_timeout
+        self._running = False
+        self._task: Optional[asyncio.Task] = None
+        # Protege únicamente altas y bajas en peer_connections
+        self._lock = asyncio.Lock()
+        # Cola de reconexiones pendientes (next_reconnect, peer_id) y señal para despertar el loop
+        self._schedule: List[Tuple[float, str]] = []
+        self._wakeup = asyncio.Event()
+        self._reconnect_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_RECONNECTS)
+        # Índice secundario de peers no conectados por estado, para no recorrer todos los peers
+        self._status_index: Dict[ConnectionStatus, Set[str]] = {status: set() for status in _NOT_ONLINE}
+        # Versión de los estados; se incrementa en cada cambio para invalidar el snapshot
+        self._status_version = 0
+        self._statuses_snapshot: Tuple[int, Mapping[str, ConnectionStatus]] = (-1, MappingProxyType({}))
+        # Notificaciones de estado pendientes de agrupar
+        self._pending_notifications: List[Tuple[str, ConnectionStatus, datetime]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Tareas en segundo plano (notificaciones y estados con debounce)
+        self._background_tasks: Set[asyncio.Task] = set()
+    
+    async def start(self):
+        """Inicia el gestor de reconexión"""
+        if self._running:
+            return
+        
+        self._running = True
+        self._task = asyncio.create_task(self._reconnection_loop())
+        logger.info("Gestor de reconexión iniciado")
+    
+    async def stop(self):
+        """Detiene el gestor de reconexión"""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        
+        # Descartar los estados con debounce aún sin aplicar y las tareas en segundo plano
+        for peer_info in self.peer_connections.values():
+            if peer_info._pending_handle is not None:
+                peer_info._pending_handle.cancel()
+                peer_info._pending_handle = None
+            peer_info._pending_online = None
+        tasks = list(self._background_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        
+        # Entregar las notificaciones pendientes antes de detenerse
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        events, self._pending_notifications = self._pending_notifications, []
+        await self._flush_notifications(events)
+        logger.info("Gestor de reconexión detenido")
+    
+    async def register_peer(self, peer_id: str, host: str, port: int, 
+                           max_attempts: int = 5, interval: int = 30):
+        """Registra un peer para monitoreo de reconexión"""
+        async with self._lock:
+            self._drop_from_index(peer_id)
+            self.peer_connections[peer_id] = PeerConnectionInfo(
+                peer_id=peer_id,
+                host=host,
+                port=port,
+                status=ConnectionStatus.CONNECTED,
+                last_seen=datetime.utcnow(),
+                max_reconnect_attempts=max_attempts,
+                reconnect_interval=interval
+            )
+            logger.info(f"Peer {peer_id} registrado para reconexión")
+    
+    async def unregister_peer(self, peer_id: str):
+        """Desregistra un peer del monitoreo"""
+        async with self._lock:
+            if peer_id in self.peer_connections:
+                self._drop_from_index(peer_id)
+                peer_info = self.peer_connections.pop(peer_id)
+                if peer_info._pending_handle is not None:
+                    peer_info._pending_handle.cancel()
+                logger.info(f"Peer {peer_id} desregistrado del monitoreo")
+    
+    async def update_peer_status(self, peer_id: str, is_online: bool):
+        """Actualiza el estado de conexión de un peer"""
+        peer_info = self.peer_connections.get(peer_id)
+        if peer_info is None:
+            return
+        
+        # Una sola lectura del reloj: se reutiliza como marca temporal del cambio al aplicarlo
+        now = datetime.utcnow()
+        peer_info.last_seen = now
+        
+        # Camino rápido: sin transición de estado ni transición pendiente no hay nada más que hacer
+        if (is_online == (peer_info.status is ConnectionStatus.CONNECTED) and
+                peer_info._pending_online is None):
+            return
+        
+        # Debounce: solo se aplica el último estado observado al cerrar la ventana,
+        # así un peer que oscila no dispara una cadena de callbacks por cada cambio
+        peer_info._pending_online = is_online
+        if peer_info._pending_handle is None:
+            peer_info._pending_handle = asyncio.get_running_loop().call_later(
+                self.STATUS_DEBOUNCE, self._start_commit_status, peer_info
+            )
+    
+    def _start_commit_status(self, peer_info: PeerConnectionInfo):
+        """Lanza la aplicación del estado pendiente al cerrar la ventana de debounce"""
+        peer_info._pending_handle = None
+        self._spawn(self._commit_status(peer_info))
+    
+    async def _commit_status(self, peer_info: PeerConnectionInfo):
+        """Aplica el último estado observado de un peer"""
+        is_online, peer_info._pending_online = peer_info._pending_online, None
+        if is_online is None or self.peer_connections.get(peer_info.peer_id) is not peer_info:
+            return
+        
+        peer_id = peer_info.peer_id
+        new_status = None
+        async with peer_info._lock:
+            # Doble verificación: el peer pudo volver a su estado original dentro de la ventana
+            if is_online != (peer_info.status is ConnectionStatus.CONNECTED):
+                if is_online:
+                    logger.info(f"Peer {peer_id} se reconectó exitosamente")
+                    self._set_status(peer_info, ConnectionStatus.CONNECTED)
+                    peer_info.reconnect_attempts = 0
+                    peer_info.next_reconnect = None
+                    new_status = ConnectionStatus.CONNECTED
+                else:
+                    logger.warning(f"Peer {peer_id} se desconectó")
+                    self._set_status(peer_info, ConnectionStatus.DISCONNECTED)
+                    self._schedule_reconnect(peer_info)
+                    new_status = ConnectionStatus.DISCONNECTED
+        
+        # Notificar fuera del lock para no bloquear otras actualizaciones del peer
+        if new_status is not None:
+            await self._notify_status_change(peer_id, new_status, peer_info.last_seen)
+    
+    async def _reconnection_loop(self):
+        """Loop principal de reconexión"""
+        while self._running:
+            try:
+                # Dormir hasta la próxima reconexión programada o hasta que se programe una nueva
+                self._wakeup.clear()
+                timeout = None
+                if self._schedule:
+                    timeout = max(0.0, self._schedule[0][0] - _now())
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+                
+                await self._check_reconnections()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error en loop de reconexión: {e}")
+                await asyncio.sleep(30)  # Esperar más tiempo en caso de error
+    
+    async def _check_reconnections(self):
+        """Verifica qué peers necesitan reconexión"""
+        # Una sola lectura del reloj para todo el barrido
+        current_time = _now()
+        peers_to_reconnect = []
+        
+        # Extraer solo las entradas vencidas; las obsoletas (reprogramadas o reiniciadas) se descartan
+        while self._schedule and self._schedule[0][0] <= current_time:
+            due_time, peer_id = heapq.heappop(self._schedule)
+            peer_info = self.peer_connections.get(peer_id)
+            if (peer_info is not None and
+                peer_info.status == ConnectionStatus.DISCONNECTED and
+                peer_info.next_reconnect == due_time and
+                peer_info.reconnect_attempts < peer_info.max_reconnect_attempts):
+                peers_to_reconnect.append(peer_id)
+        
+        # Procesar reconexiones en paralelo
+        if peers_to_reconnect:
+            await asyncio.gather(
+                *(self._attempt_reconnection(peer_id) for peer_id in peers_to_reconnect),
+                return_exceptions=True
+            )
+    
+    async def _attempt_reconnection(self, peer_id: str):
+        """Intenta reconectar un peer"""
+        async with self._reconnect_semaphore:
+            await self._do_attempt_reconnection(peer_id)
+    
+    async def _do_attempt_reconnection(self, peer_id: str):
+        """Ejecuta un intento de reconexión de un peer"""
+        peer_info = self.peer_connections.get(peer_id)
+        if peer_info is None:
+            return
+        
+        async with peer_info._lock:
+            self._set_status(peer_info, ConnectionStatus.RECONNECTING)
+            peer_info.reconnect_attempts += 1
+        
+        logger.info(f"Intentando reconectar peer {peer_id} (intento {peer_info.reconnect_attempts})")
+        
+        try:
+            # Notificar que se está intentando reconectar
+            await self._notify_status_change(peer_id, ConnectionStatus.RECONNECTING)
+            
+            # Ejecutar callbacks de reconexión en paralelo
+            callbacks = self.reconnect_callbacks
+            await asyncio.gather(*(
+                self._run_callback("reconexión", callback, peer_id, peer_info.host, peer_info.port)
+                for callback in callbacks
+            ))
+            
+            # Verificar que el peer vuelve a aceptar conexiones
+            if not await self._probe_peer(peer_info.host, peer_info.port):
+                raise ConnectionError(f"{peer_info.host}:{peer_info.port} no acepta conexiones")
+            
+            async with peer_info._lock:
+                self._set_status(peer_info, ConnectionStatus.CONNECTED)
+                peer_info.reconnect_attempts = 0
+                peer_info.next_reconnect = None
+            
+            logger.info(f"Peer {peer_id} reconectado exitosamente")
+            await self._notify_status_change(peer_id, ConnectionStatus.CONNECTED)
+            
+        except Exception as e:
+            logger.error(f"Error reconectando peer {peer_id}: {e}")
+            
+            # Una sola sección crítica decide entre fallido y reintento
+            async with peer_info._lock:
+                if peer_info.reconnect_attempts >= peer_info.max_reconnect_attempts:
+                    # Si se agotaron los intentos, marcar como fallido
+                    self._set_status(peer_info, ConnectionStatus.FAILED)
+                    peer_info.next_reconnect = None
+                else:
+                    self._set_status(peer_info, ConnectionStatus.DISCONNECTED)
+                    self._schedule_reconnect(peer_info)
+                final_status = peer_info.status
+            
+            if final_status is ConnectionStatus.FAILED:
+                logger.error(f"Peer {peer_id} falló después de {peer_info.max_reconnect_attempts} intentos")
+            await self._notify_status_change(peer_id, final_status)
+    
+    async def _probe_peer(self, host: str, port: int) -> bool:
+        """Comprueba con un timeout acotado si el peer acepta conexiones TCP"""
+        # Misma resolución que el resto de llamadas a peers (localhost -> contenedor Docker)
+        host, _, mapped_port = map_host(host, port).rpartition(':')
+        port = int(mapped_port)
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(host, port), timeout=self.CONNECTION_TIMEOUT
+            )
+        except (OSError, asyncio.TimeoutError):
+            return False
+        
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return True
+    
+    async def _notify_status_change(self, peer_id: str, status: ConnectionStatus,
+                                    changed_at: Optional[datetime] = None):
+        """Encola un cambio de estado; se notifica en lote al cerrar la ventana de agrupación"""
+        self._pending_notifications.append((peer_id, status, changed_at or datetime.utcnow()))
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self.NOTIFY_COALESCE_WINDOW, self._start_flush
+            )
+    
+    def _start_flush(self):
+        """Lanza el envío de las notificaciones acumuladas"""
+        self._flush_handle = None
+        events, self._pending_notifications = self._pending_notifications, []
+        self._spawn(self._flush_notifications(events))
+    
+    def _spawn(self, coro):
+        """Crea una tarea en segundo plano manteniendo una referencia hasta que termine"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    async def _flush_notifications(self, events: List[Tuple[str, ConnectionStatus, datetime]]):
+        """Notifica un lote de cambios de estado"""
+        if not events:
+            return
+        batch_callbacks = self.status_batch_callbacks
+        await asyncio.gather(
+            *(self._run_callback("estado", callback, events) for callback in batch_callbacks),
+            self._dispatch_per_event(events)
+        )
+    
+    async def _dispatch_per_event(self, events: List[Tuple[str, ConnectionStatus, datetime]]):
+        """Notifica evento por evento a los callbacks sin firma de lote, en orden"""
+        callbacks = self.status_callbacks
+        if not callbacks:
+            return
+        for peer_id, status, _ in events:
+            await asyncio.gather(
+                *(self._run_callback("estado", callback, peer_id, status) for callback in callbacks)
+            )
+    
+    async def _run_callback(self, kind: str, callback: Callable, *args):
+        """Ejecuta un callback con tiempo máximo; los errores se registran y no se propagan"""
+        try:
+            await asyncio.wait_for(callback(*args), timeout=self.callback_timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Callback de {kind} excedió el tiempo máximo de {self.callback_timeout}s")
+        except Exception as e:
+            logger.error(f"Error en callback de {kind}: {e}")
+    
+    def _set_status(self, peer_info: PeerConnectionInfo, status: ConnectionStatus):
+        """Cambia el estado de un peer manteniendo el índice por estado"""
+        if peer_info.status in _NOT_ONLINE:
+            self._status_index[peer_info.status].discard(peer_info.peer_id)
+        peer_info.status = status
+        self._status_version += 1
+        if status in _NOT_ONLINE:
+            self._status_index[status].add(peer_info.peer_id)
+    
+    def _drop_from_index(self, peer_id: str):
+        """Elimina un peer del índice por estado"""
+        for peers in self._status_index.values():
+            peers.discard(peer_id)
+        self._status_version += 1
+    
+    def _schedule_reconnect(self, peer_info: PeerConnectionInfo):
+        """Programa el próximo intento de reconexión y despierta el loop"""
+        peer_info.next_reconnect = _now() + self._backoff_delay(peer_info)
+        heapq.heappush(self._schedule, (peer_info.next_reconnect, peer_info.peer_id))
+        self._wakeup.set()
+    
+    def _backoff_delay(self, peer_info: PeerConnectionInfo) -> float:
+        """Calcula la espera hasta el próximo intento: backoff exponencial con jitter"""
+        delay = min(self.MAX_RECONNECT_DELAY, peer_info.reconnect_interval * 2 ** peer_info.reconnect_attempts)
+        return delay + random.uniform(0, self.RECONNECT_JITTER)
+    
+    def add_reconnect_callback(self, callback: Callable):
+        """Agrega un callback para reconexión"""
+        self.reconnect_callbacks = self.reconnect_callbacks + (callback,)
+    
+    def add_status_callback(self, callback: Callable):
+        """Agrega un callback para cambios de estado"""
+        self.status_callbacks = self.status_callbacks + (callback,)
+    
+    def add_status_batch_callback(self, callback: Callable):
+        """Agrega un callback que recibe lotes de cambios de estado [(peer_id, status, changed_at), ...]"""
+        self.status_batch_callbacks = self.status_batch_callbacks + (callback,)
+    
+    def get_peer_status(self, peer_id: str) -> Optional[ConnectionStatus]:
+        """Obtiene el estado de un peer"""
+        peer_info = self.peer_connections.get(peer_id)
+        return peer_info.status if peer_info else None
+    
+    def get_all_peer_statuses(self) -> Mapping[str, ConnectionStatus]:
+        """Obtiene el estado de todos los peers (vista de solo lectura)"""
+        version, snapshot = self._statuses_snapshot
+        if version != self._status_version:
+            # Snapshot sin lock: no bloquea las escrituras durante el recorrido
+            version = self._status_version
+            snapshot = MappingProxyType({peer_id: info.status for peer_id, info in list(self.peer_connections.items())})
+            self._statuses_snapshot = (version, snapshot)
+        return snapshot
+    
+    def get_disconnected_peers(self) -> List[str]:
+        """Obtiene lista de peers desconectados"""
+        return list(set().union(*self._status_index.values()))
+    
+    async def reset_peer_attempts(self, peer_id: str):
+        """Reinicia los intentos de reconexión de un peer"""
+        peer_info = self.peer_connections.get(peer_id)
+        if peer_info is None:
+            return
+        
+        async with peer_info._lock:
+            peer_info.reconnect_attempts = 0
+            peer_info.next_reconnect = None
+            logger.info(f"Intentos de reconexión reiniciados para peer {peer_id}")
+
+# Instancia global del gestor de reconexión
+reconnection_manager = ReconnectionManager()
@@ -1,257 +1,300 @@
-"""
-Sistema de logging avanzado y estructurado
-"""
-
-import logging
-import json
-import sys
-from datetime import datetime
-from typing import Dict, Any, Optional
-from pathlib import Path
-import traceback
-
-class StructuredFormatter(logging.Formatter):
-    """Formateador de logs estructurados en JSON"""
-    
-    def format(self, record):
-        log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "level": record.levelname,
-            "logger": record.name,
-            "message": record.getMessage(),
-            "module": record.module,
-            "function": record.funcName,
-            "line": record.lineno,
-            "thread": record.thread,
-            "process": record.process
-        }
-        
-        # Agregar información adicional si existe
-        if hasattr(record, 'extra_data'):
-            log_entry["extra_data"] = record.extra_data
-        
-        if hasattr(record, 'user_id'):
-            log_entry["user_id"] = record.user_id
-        
-        if hasattr(record, 'request_id'):
-            log_entry["request_id"] = record.request_id
-        
-        if hasattr(record, 'peer_id'):
-            log_entry["peer_id"] = record.peer_id
-        
-        if hasattr(record, 'file_hash'):
-            log_entry["file_hash"] = record.file_hash
-        
-        # Agregar excepción si existe
-        if record.exc_info:
-            log_entry["exception"] = {
-                "type": record.exc_info[0].__name__,
-                "message": str(record.exc_info[1]),
-                "traceback": traceback.format_exception(*record.exc_info)
-            }
-        
-        return json.dumps(log_entry, ensure_ascii=False)
-
-class BusinessMetricsLogger:
-    """Logger para métricas de negocio"""
-    
-    def __init__(self, logger_name: str = "business_metrics"):
-        self.logger = logging.getLogger(logger_name)
-        self.logger.setLevel(logging.INFO)
-        
-        # Configurar handler para métricas
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setFormatter(StructuredFormatter())
-        self.logger.addHandler(handler)
-    
-    def log_peer_activity(self, peer_id: str, action: str, details: Dict[str, Any] = None):
-        """Registra actividad de peer"""
-        self.logger.info(
-            f"Peer activity: {action}",
-            extra={
-                "peer_id": peer_id,
-                "action": action,
-                "extra_data": details or {}
-            }
-        )
-    
-    def log_file_operation(self, file_hash: str, operation: str, peer_id: str = None, details: Dict[str, Any] = None):
-        """Registra operación de archivo"""
-        self.logger.info(
-            f"File operation: {operation}",
-            extra={
-                "file_hash": file_hash,
-                "operation": operation,
-                "peer_id": peer_id,
-                "extra_data": details or {}
-            }
-        )
-    
-    def log_transfer_event(self, transfer_id: str, event: str, details: Dict[str, Any] = None):
-        """Registra evento de transferencia"""
-        self.logger.info(
-            f"Transfer event: {event}",
-            extra={
-                "transfer_id": transfer_id,
-                "event": event,
-                "extra_data": details or {}
-            }
-        )
-    
-    def log_system_event(self, event: str, details: Dict[str, Any] = None):
-        """Registra evento del sistema"""
-        self.logger.info(
-            f"System event: {event}",
-            extra={
-                "event": event,
-                "extra_data": details or {}
-            }
-        )
-
-class PerformanceLogger:
-    """Logger para métricas de performance"""
-    
-    def __init__(self, logger_name: str = "performance"):
-        self.logger = logging.getLogger(logger_name)
-        self.logger.setLevel(logging.INFO)
-        
-        # Configurar handler para performance
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setFormatter(StructuredFormatter())
-        self.logger.addHandler(handler)
-    
-    def log_api_request(self, method: str, path: str, duration_ms: float, status_code: int, user_id: str = None):
-        """Registra petición API"""
-        self.logger.info(
-            f"API request: {method} {path}",
-            extra={
-                "method": method,
-                "path": path,
-                "duration_ms": duration_ms,
-                "status_code": status_code,
-                "user_id": user_id,
-                "extra_data": {
-                    "request_type": "api"
-                }
-            }
-        )
-    
-    def log_database_query(self, query_type: str, duration_ms: float, rows_affected: int = None):
-        """Registra consulta de base de datos"""
-        self.logger.info(
-            f"Database query: {query_type}",
-            extra={
-                "query_type": query_type,
-                "duration_ms": duration_ms,
-                "rows_affected": rows_affected,
-                "extra_data": {
-                    "request_type": "database"
-                }
-            }
-        )
-    
-    def log_cache_operation(self, operation: str, key: str, hit: bool, duration_ms: float = None):
-        """Registra operación de cache"""
-        self.logger.info(
-            f"Cache operation: {operation}",
-            extra={
-                "operation": operation,
-                "key": key,
-                "hit": hit,
-                "duration_ms": duration_ms,
-                "extra_data": {
-                    "request_type": "cache"
-                }
-            }
-        )
-
-def setup_advanced_logging(log_level: str = "INFO", log_file: str = None):
-    """Configura el sistema de logging avanzado"""
-    
-    # Crear directorio de logs si no existe
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
-    
-    # Configurar logger raíz
-    root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, log_level.upper()))
-    
-    # Limpiar handlers existentes
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
-    
-    # Handler para consola
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(StructuredFormatter())
-    root_logger.addHandler(console_handler)
-    
-    # Handler para archivo si se especifica
-    if log_file:
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(StructuredFormatter())
-        root_logger.addHandler(file_handler)
-    
-    # Configurar loggers específicos
-    logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
-    logging.getLogger("uvicorn.error").setLevel(logging.INFO)
-    
-    return root_logger
-
-# Instancias globales
-business_logger = BusinessMetricsLogger()
-performance_logger = PerformanceLogger()
-
-# Decorador para logging de performance
-def log_performance(operation_name: str):
-    """Decorador para logging automático de performance"""
-    def decorator(func):
-        async def async_wrapper(*args, **kwargs):
-            start_time = datetime.utcnow()
-            try:
-                result = await func(*args, **kwargs)
-                duration = (datetime.utcnow() - start_time).total_seconds() * 1000
-                performance_logger.log_api_request(
-                    method=operation_name,
-                    path=func.__name__,
-                    duration_ms=duration,
-                    status_code=200
-                )
-                return result
-            except Exception as e:
-                duration = (datetime.utcnow() - start_time).total_seconds() * 1000
-                performance_logger.log_api_request(
-                    method=operation_name,
-                    path=func.__name__,
-                    duration_ms=duration,
-                    status_code=500
-                )
-                raise e
-        
-        def sync_wrapper(*args, **kwargs):
-            start_time = datetime.utcnow()
-            try:
-                result = func(*args, **kwargs)
-                duration = (datetime.utcnow() - start_time).total_seconds() * 1000
-                performance_logger.log_api_request(
-                    method=operation_name,
-                    path=func.__name__,
-                    duration_ms=duration,
-                    status_code=200
-                )
-                return result
-            except Exception as e:
-                duration = (datetime.utcnow() - start_time).total_seconds() * 1000
-                performance_logger.log_api_request(
-                    method=operation_name,
-                    path=func.__name__,
-                    duration_ms=duration,
-                    status_code=500
-                )
-                raise e
-        
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
-    
-    return decorator
+"""
+Sistema de logging avanzado y estructurado
+"""
+
+import asyncio
+import logging
+import logging.handlers
+import atexit
+import threading
+import orjson
+import sys
+import time
+from datetime import datetime
+from typing import Dict, Any, Optional
+from pathlib import Path
+import traceback
+
+class StructuredFormatter(logging.Formatter):
+    """Formateador de logs estructurados en JSON"""
+    
+    # Campos opcionales que se copian del registro si llegaron en 'extra'
+    OPTIONAL_FIELDS = ('extra_data', 'user_id', 'request_id', 'peer_id', 'file_hash')
+    
+    def format(self, record):
+        log_entry = {
+            # Momento en que se emitió el registro (no el de escritura, que puede ir en lote)
+            "timestamp": datetime.utcfromtimestamp(record.created),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+            "thread": record.thread,
+            "process": record.process
+        }
+        
+        # Agregar información adicional si existe (una consulta al __dict__ por campo, sin hasattr)
+        attrs = record.__dict__
+        for key in self.OPTIONAL_FIELDS:
+            if key in attrs:
+                log_entry[key] = attrs[key]
+        
+        # Agregar excepción si existe
+        if record.exc_info:
+            log_entry["exception"] = {
+                "type": record.exc_info[0].__name__,
+                "message": str(record.exc_info[1]),
+                "traceback": traceback.format_exception(*record.exc_info)
+            }
+        
+        # orjson serializa el datetime de forma nativa y escribe UTF-8 directamente;
+        # claves no str y tipos no soportados en extra_data se convierten a texto
+        return orjson.dumps(
+            log_entry,
+            default=str,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+        ).decode('utf-8')
+
+class BufferedStreamHandler(logging.handlers.MemoryHandler):
+    """
+    Acumula registros en memoria y los escribe a la salida en lote: al llenarse el buffer,
+    al llegar un registro de nivel ERROR o superior, o cada flush_interval segundos
+    """
+    
+    def __init__(self, stream=None, capacity: int = 512, flush_interval: float = 1.0):
+        target = logging.StreamHandler(stream or sys.stdout)
+        super().__init__(capacity, flushLevel=logging.ERROR, target=target, flushOnClose=True)
+        self.flush_interval = flush_interval
+        # Hilo que vacía el buffer periódicamente aunque no lleguen más registros
+        self._stop_event = threading.Event()
+        self._flush_thread = threading.Thread(
+            target=self._flush_periodically, name="log-buffer-flush", daemon=True
+        )
+        self._flush_thread.start()
+        # Vaciar lo pendiente al terminar el proceso
+        atexit.register(self.flush)
+    
+    def setFormatter(self, fmt):
+        """El formato lo aplica el handler de destino al escribir"""
+        super().setFormatter(fmt)
+        self.target.setFormatter(fmt)
+    
+    def _flush_periodically(self):
+        """Escribe lo acumulado cada flush_interval hasta que se cierre el handler"""
+        while not self._stop_event.wait(self.flush_interval):
+            if self.buffer:
+                self.flush()
+    
+    def close(self):
+        """Detiene el vaciado periódico y escribe lo pendiente"""
+        self._stop_event.set()
+        self._flush_thread.join(timeout=self.flush_interval)
+        super().close()
+
+class BusinessMetricsLogger:
+    """Logger para métricas de negocio"""
+    
+    def __init__(self, logger_name: str = "business_metrics"):
+        self.logger = logging.getLogger(logger_name)
+        self.logger.setLevel(logging.INFO)
+        
+        # Configurar handler para métricas (escritura en lote)
+        handler = BufferedStreamHandler(sys.stdout)
+        handler.setFormatter(StructuredFormatter())
+        self.logger.addHandler(handler)
+    
+    def log_peer_activity(self, peer_id: str, action: str, details: Dict[str, Any] = None):
+        """Registra actividad de peer"""
+        self.logger.info(
+            f"Peer activity: {action}",
+            extra={
+                "peer_id": peer_id,
+                "action": action,
+                "extra_data": details or {}
+            }
+        )
+    
+    def log_file_operation(self, file_hash: str, operation: str, peer_id: str = None, details: Dict[str, Any] = None):
+        """Registra operación de archivo"""
+        self.logger.info(
+            f"File operation: {operation}",
+            extra={
+                "file_hash": file_hash,
+                "operation": operation,
+                "peer_id": peer_id,
+                "extra_data": details or {}
+            }
+        )
+    
+    def log_transfer_event(self, transfer_id: str, event: str, details: Dict[str, Any] = None):
+        """Registra evento de transferencia"""
+        self.logger.info(
+            f"Transfer event: {event}",
+            extra={
+                "transfer_id": transfer_id,
+                "event": event,
+                "extra_data": details or {}
+            }
+        )
+    
+    def log_system_event(self, event: str, details: Dict[str, Any] = None):
+        """Registra evento del sistema"""
+        self.logger.info(
+            f"System event: {event}",
+            extra={
+                "event": event,
+                "extra_data": details or {}
+            }
+        )
+
+class PerformanceLogger:
+    """Logger para métricas de performance"""
+    
+    def __init__(self, logger_name: str = "performance"):
+        self.logger = logging.getLogger(logger_name)
+        self.logger.setLevel(logging.INFO)
+        
+        # Configurar handler para performance (escritura en lote)
+        handler = BufferedStreamHandler(sys.stdout)
+        handler.setFormatter(StructuredFormatter())
+        self.logger.addHandler(handler)
+    
+    def log_api_request(self, method: str, path: str, duration_ms: float, status_code: int, user_id: str = None):
+        """Registra petición API"""
+        self.logger.info(
+            f"API request: {method} {path}",
+            extra={
+                "method": method,
+                "path": path,
+                "duration_ms": duration_ms,
+                "status_code": status_code,
+                "user_id": user_id,
+                "extra_data": {
+                    "request_type": "api"
+                }
+            }
+        )
+    
+    def log_database_query(self, query_type: str, duration_ms: float, rows_affected: int = None):
+        """Registra consulta de base de datos"""
+        self.logger.info(
+            f"Database query: {query_type}",
+            extra={
+                "query_type": query_type,
+                "duration_ms": duration_ms,
+                "rows_affected": rows_affected,
+                "extra_data": {
+                    "request_type": "database"
+                }
+            }
+        )
+    
+    def log_cache_operation(self, operation: str, key: str, hit: bool, duration_ms: float = None):
+        """Registra operación de cache"""
+        self.logger.info(
+            f"Cache operation: {operation}",
+            extra={
+                "operation": operation,
+                "key": key,
+                "hit": hit,
+                "duration_ms": duration_ms,
+                "extra_data": {
+                    "request_type": "cache"
+                }
+            }
+        )
+
+def setup_advanced_logging(log_level: str = "INFO", log_file: str = None):
+    """Configura el sistema de logging avanzado"""
+    
+    # Crear directorio de logs si no existe
+    log_dir = Path("logs")
+    log_dir.mkdir(exist_ok=True)
+    
+    # Configurar logger raíz
+    root_logger = logging.getLogger()
+    root_logger.setLevel(getattr(logging, log_level.upper()))
+    
+    # Limpiar handlers existentes
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    
+    # Handler para consola
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(StructuredFormatter())
+    root_logger.addHandler(console_handler)
+    
+    # Handler para archivo si se especifica
+    if log_file:
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(StructuredFormatter())
+        root_logger.addHandler(file_handler)
+    
+    # Configurar loggers específicos
+    logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
+    logging.getLogger("uvicorn.error").setLevel(logging.INFO)
+    
+    return root_logger
+
+# Instancias globales
+business_logger = BusinessMetricsLogger()
+performance_logger = PerformanceLogger()
+
+# Decorador para logging de performance
+def log_performance(operation_name: str):
+    """Decorador para logging automático de performance"""
+    def decorator(func):
+        async def async_wrapper(*args, **kwargs):
+            # Reloj monotónico en ns: sin crear objetos datetime en cada llamada
+            start_time = time.perf_counter_ns()
+            try:
+                result = await func(*args, **kwargs)
+                duration = (time.perf_counter_ns() - start_time) / 1_000_000
+                performance_logger.log_api_request(
+                    method=operation_name,
+                    path=func.__name__,
+                    duration_ms=duration,
+                    status_code=200
+                )
+                return result
+            except Exception as e:
+                duration = (time.perf_counter_ns() - start_time) / 1_000_000
+                performance_logger.log_api_request(
+                    method=operation_name,
+                    path=func.__name__,
+                    duration_ms=duration,
+                    status_code=500
+                )
+                raise e
+        
+        def sync_wrapper(*args, **kwargs):
+            # Reloj monotónico en ns: sin crear objetos datetime en cada llamada
+            start_time = time.perf_counter_ns()
+            try:
+                result = func(*args, **kwargs)
+                duration = (time.perf_counter_ns() - start_time) / 1_000_000
+                performance_logger.log_api_request(
+                    method=operation_name,
+                    path=func.__name__,
+                    duration_ms=duration,
+                    status_code=200
+                )
+                return result
+            except Exception as e:
+                duration = (time.perf_counter_ns() - start_time) / 1_000_000
+                performance_logger.log_api_request(
+                    method=operation_name,
+                    path=func.__name__,
+                    duration_ms=duration,
+                    status_code=500
+                )
+                raise e
+        
+        if asyncio.iscoroutinefunction(func):
+            return async_wrapper
+        else:
+            return sync_wrapper
+    
+    return decorator
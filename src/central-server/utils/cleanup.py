@@ -1,70 +1,94 @@
-"""
-Utilidades para limpieza de archivos temporales
-"""
-
-import os
-import time
-import logging
-from pathlib import Path
-
-logger = logging.getLogger(__name__)
-
-def cleanup_temp_files(temp_dir: str = "/tmp/redp2p_uploads", max_age_hours: int = 24):
-    """
-    Limpia archivos temporales más antiguos que max_age_hours
-    
-    Args:
-        temp_dir: Directorio temporal a limpiar
-        max_age_hours: Edad máxima en horas para mantener archivos
-    """
-    try:
-        if not os.path.exists(temp_dir):
-            logger.info(f"Directorio temporal {temp_dir} no existe")
-            return
-        
-        current_time = time.time()
-        max_age_seconds = max_age_hours * 3600
-        cleaned_count = 0
-        total_size = 0
-        
-        for file_path in Path(temp_dir).iterdir():
-            if file_path.is_file():
-                file_age = current_time - file_path.stat().st_mtime
-                
-                if file_age > max_age_seconds:
-                    file_size = file_path.stat().st_size
-                    try:
-                        file_path.unlink()
-                        cleaned_count += 1
-                        total_size += file_size
-                        logger.info(f"Archivo temporal eliminado: {file_path}")
-                    except Exception as e:
-                        logger.warning(f"Error eliminando archivo {file_path}: {e}")
-        
-        if cleaned_count > 0:
-            logger.info(f"Limpieza completada: {cleaned_count} archivos, {total_size} bytes liberados")
-        else:
-            logger.info("No hay archivos temporales para limpiar")
-            
-    except Exception as e:
-        logger.error(f"Error en limpieza de archivos temporales: {e}")
-
-def safe_remove_file(file_path: str) -> bool:
-    """
-    Elimina un archivo de forma segura
-    
-    Args:
-        file_path: Ruta del archivo a eliminar
-        
-    Returns:
-        True si se eliminó correctamente, False en caso contrario
-    """
-    try:
-        if os.path.exists(file_path):
-            os.remove(file_path)
-            logger.info(f"Archivo eliminado: {file_path}")
-            return True
-        return False
-    except Exception as e:
-        logger.warning(f"Error eliminando archivo {file_path}: {e}")
-        return False
+"""
+Utilidades para limpieza de archivos temporales
+"""
+
+import os
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
+
+logger = logging.getLogger(__name__)
+
+# Por debajo de este número de archivos se borra en serie: el pool no compensa su coste
+PARALLEL_UNLINK_THRESHOLD = 16
+# Hilos para borrar en paralelo (os.unlink libera el GIL mientras espera al sistema de archivos)
+UNLINK_WORKERS = 8
+
+def _safe_unlink(item: Tuple[str, int]) -> Tuple[int, bool]:
+    """Elimina un archivo y devuelve (bytes liberados, éxito)"""
+    path, size = item
+    try:
+        os.unlink(path)
+        logger.info(f"Archivo temporal eliminado: {path}")
+        return size, True
+    except Exception as e:
+        logger.warning(f"Error eliminando archivo {path}: {e}")
+        return 0, False
+
+def cleanup_temp_files(temp_dir: str = "/tmp/redp2p_uploads", max_age_hours: int = 24):
+    """
+    Limpia archivos temporales más antiguos que max_age_hours
+    
+    Args:
+        temp_dir: Directorio temporal a limpiar
+        max_age_hours: Edad máxima en horas para mantener archivos
+    """
+    try:
+        if not os.path.exists(temp_dir):
+            logger.info(f"Directorio temporal {temp_dir} no existe")
+            return
+        
+        current_time = time.time()
+        max_age_seconds = max_age_hours * 3600
+        to_delete = []
+        
+        # os.scandir devuelve entradas con el tipo y el stat en caché: un solo stat por archivo
+        with os.scandir(temp_dir) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                
+                st = entry.stat(follow_symlinks=False)
+                file_age = current_time - st.st_mtime
+                
+                if file_age > max_age_seconds:
+                    to_delete.append((entry.path, st.st_size))
+        
+        # Borrar en paralelo cuando hay muchos archivos
+        if len(to_delete) < PARALLEL_UNLINK_THRESHOLD:
+            results = [_safe_unlink(item) for item in to_delete]
+        else:
+            with ThreadPoolExecutor(max_workers=UNLINK_WORKERS) as executor:
+                results = list(executor.map(_safe_unlink, to_delete))
+        
+        cleaned_count = sum(1 for _, ok in results if ok)
+        total_size = sum(size for size, _ in results)
+        
+        if cleaned_count > 0:
+            logger.info(f"Limpieza completada: {cleaned_count} archivos, {total_size} bytes liberados")
+        else:
+            logger.info("No hay archivos temporales para limpiar")
+            
+    except Exception as e:
+        logger.error(f"Error en limpieza de archivos temporales: {e}")
+
+def safe_remove_file(file_path: str) -> bool:
+    """
+    Elimina un archivo de forma segura
+    
+    Args:
+        file_path: Ruta del archivo a eliminar
+        
+    Returns:
+        True si se eliminó correctamente, False en caso contrario
+    """
+    try:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+            logger.info(f"Archivo eliminado: {file_path}")
+            return True
+        return False
+    except Exception as e:
+        logger.warning(f"Error eliminando archivo {file_path}: {e}")
+        return False
@@ -1,102 +1,117 @@
-"""
-Utilidades para validación de archivos
-"""
-
-import os
-import hashlib
-from typing import List, Tuple
-from fastapi import HTTPException
-
-# Configuración de validación
-ALLOWED_EXTENSIONS = {
-    '.pdf', '.txt', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
-    '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg',
-    '.mp3', '.mp4', '.avi', '.mov', '.wav',
-    '.zip', '.rar', '.7z', '.tar', '.gz',
-    '.py', '.js', '.html', '.css', '.json', '.xml'
-}
-
-MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
-MIN_FILE_SIZE = 1  # 1 byte
-
-def validate_file_extension(filename: str) -> bool:
-    """Valida la extensión del archivo"""
-    if not filename:
-        return False
-    
-    _, ext = os.path.splitext(filename.lower())
-    return ext in ALLOWED_EXTENSIONS
-
-def validate_file_size(size: int) -> bool:
-    """Valida el tamaño del archivo"""
-    return MIN_FILE_SIZE <= size <= MAX_FILE_SIZE
-
-def validate_filename(filename: str) -> bool:
-    """Valida el nombre del archivo"""
-    if not filename or len(filename) == 0:
-        return False
-    
-    # Verificar caracteres peligrosos
-    dangerous_chars = ['..', '/', '\\', ':', '*', '?', '"', '<', '>', '|']
-    for char in dangerous_chars:
-        if char in filename:
-            return False
-    
-    # Verificar longitud máxima
-    if len(filename) > 255:
-        return False
-    
-    return True
-
-def validate_file_content(content: bytes) -> Tuple[bool, str]:
-    """Valida el contenido del archivo"""
-    if not content:
-        return False, "Archivo vacío"
-    
-    # Verificar tamaño
-    if len(content) > MAX_FILE_SIZE:
-        return False, f"Archivo demasiado grande. Máximo: {MAX_FILE_SIZE} bytes"
-    
-    if len(content) < MIN_FILE_SIZE:
-        return False, f"Archivo demasiado pequeño. Mínimo: {MIN_FILE_SIZE} bytes"
-    
-    return True, ""
-
-def calculate_file_hash(content: bytes) -> str:
-    """Calcula el hash SHA256 del archivo"""
-    return hashlib.sha256(content).hexdigest()
-
-def validate_upload_file(filename: str, content: bytes) -> Tuple[bool, str, str]:
-    """
-    Valida completamente un archivo para subida
-    Retorna: (es_válido, mensaje_error, hash_archivo)
-    """
-    # Validar nombre
-    if not validate_filename(filename):
-        return False, "Nombre de archivo inválido", ""
-    
-    # Validar extensión
-    if not validate_file_extension(filename):
-        allowed_exts = ", ".join(sorted(ALLOWED_EXTENSIONS))
-        return False, f"Extensión no permitida. Permitidas: {allowed_exts}", ""
-    
-    # Validar contenido
-    is_valid_content, content_error = validate_file_content(content)
-    if not is_valid_content:
-        return False, content_error, ""
-    
-    # Calcular hash
-    file_hash = calculate_file_hash(content)
-    
-    return True, "", file_hash
-
-def get_safe_temp_path(filename: str, file_hash: str) -> str:
-    """Genera una ruta temporal segura para el archivo"""
-    # Crear directorio temporal seguro
-    temp_dir = "/tmp/redp2p_uploads"
-    os.makedirs(temp_dir, exist_ok=True)
-    
-    # Generar nombre seguro
-    safe_filename = f"{file_hash}_{filename}"
-    
-    return os.path.join(temp_dir, safe_filename)
+"""
+Utilidades para validación de archivos
+"""
+
+import io
+import os
+import re
+import hashlib
+from typing import BinaryIO, List, Optional, Tuple
+from fastapi import HTTPException
+
+# Configuración de validación
+ALLOWED_EXTENSIONS = frozenset({
+    '.pdf', '.txt', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+    '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg',
+    '.mp3', '.mp4', '.avi', '.mov', '.wav',
+    '.zip', '.rar', '.7z', '.tar', '.gz',
+    '.py', '.js', '.html', '.css', '.json', '.xml'
+})
+# Lista de extensiones para el mensaje de error, construida una sola vez
+_ALLOWED_EXT_MSG = ", ".join(sorted(ALLOWED_EXTENSIONS))
+
+MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
+MIN_FILE_SIZE = 1  # 1 byte
+
+# Directorio temporal seguro para subidas, creado una sola vez al importar el módulo
+_TEMP_DIR = "/tmp/redp2p_uploads"
+os.makedirs(_TEMP_DIR, exist_ok=True)
+
+# Secuencias peligrosas en nombres de archivo ('..' y separadores/comodines), en una sola pasada
+_DANGEROUS_FILENAME_RE = re.compile(r'\.\.|[/\\:*?"<>|]')
+
+def validate_file_extension(filename: str) -> bool:
+    """Valida la extensión del archivo"""
+    if not filename:
+        return False
+    
+    _, ext = os.path.splitext(filename.lower())
+    return ext in ALLOWED_EXTENSIONS
+
+def validate_file_size(size: int) -> bool:
+    """Valida el tamaño del archivo"""
+    return MIN_FILE_SIZE <= size <= MAX_FILE_SIZE
+
+def validate_filename(filename: str) -> bool:
+    """Valida el nombre del archivo"""
+    if not filename:
+        return False
+    
+    # Verificar longitud máxima
+    if len(filename) > 255:
+        return False
+    
+    # Verificar caracteres peligrosos
+    return _DANGEROUS_FILENAME_RE.search(filename) is None
+
+def _validate_content_size(size: int) -> Tuple[bool, str]:
+    """Valida el tamaño del contenido de un archivo"""
+    if size == 0:
+        return False, "Archivo vacío"
+    
+    # Verificar tamaño
+    if size > MAX_FILE_SIZE:
+        return False, f"Archivo demasiado grande. Máximo: {MAX_FILE_SIZE} bytes"
+    
+    if size < MIN_FILE_SIZE:
+        return False, f"Archivo demasiado pequeño. Mínimo: {MIN_FILE_SIZE} bytes"
+    
+    return True, ""
+
+def validate_file_content(content: bytes) -> Tuple[bool, str]:
+    """Valida el contenido del archivo"""
+    return _validate_content_size(len(content) if content else 0)
+
+def calculate_file_hash(content: bytes) -> str:
+    """Calcula el hash SHA256 del archivo"""
+    return hashlib.sha256(content).hexdigest()
+
+def calculate_file_hash_stream(fp: BinaryIO) -> str:
+    """Calcula el hash SHA256 leyendo el archivo por bloques, sin cargarlo en memoria"""
+    return hashlib.file_digest(fp, 'sha256').hexdigest()
+
+def validate_upload_file(filename: str, content: Optional[bytes] = None,
+                         file_obj: Optional[BinaryIO] = None) -> Tuple[bool, str, str]:
+    """
+    Valida completamente un archivo para subida
+    Acepta el contenido en memoria o un objeto de archivo (se valida y hashea sin leerlo entero)
+    Retorna: (es_válido, mensaje_error, hash_archivo)
+    """
+    # Validar nombre
+    if not validate_filename(filename):
+        return False, "Nombre de archivo inválido", ""
+    
+    # Validar extensión
+    if not validate_file_extension(filename):
+        return False, f"Extensión no permitida. Permitidas: {_ALLOWED_EXT_MSG}", ""
+    
+    if file_obj is None:
+        file_obj = io.BytesIO(content or b"")
+    
+    # Validar contenido: el tamaño se obtiene del final del archivo, sin leerlo
+    size = file_obj.seek(0, os.SEEK_END)
+    file_obj.seek(0)
+    is_valid_content, content_error = _validate_content_size(size)
+    if not is_valid_content:
+        return False, content_error, ""
+    
+    # Calcular hash y dejar el archivo al inicio para quien lo lea después
+    file_hash = calculate_file_hash_stream(file_obj)
+    file_obj.seek(0)
+    
+    return True, "", file_hash
+
+def get_safe_temp_path(filename: str, file_hash: str) -> str:
+    """Genera una ruta temporal segura para el archivo"""
+    # Nombre seguro dentro del directorio temporal creado al importar el módulo
+    return os.path.join(_TEMP_DIR, f"{file_hash}_{filename}")
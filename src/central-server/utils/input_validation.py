@@ -1,230 +1,286 @@
-"""
-Utilidades de validación de entrada para APIs
-"""
-
-import re
-import ipaddress
-from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, validator
-import logging
-
-logger = logging.getLogger(__name__)
-
-class ValidationError(Exception):
-    """Excepción personalizada para errores de validación"""
-    pass
-
-class InputValidator:
-    """Validador de entradas para APIs"""
-    
-    # Patrones de validación
-    PATTERNS = {
-        'peer_id': r'^[a-zA-Z0-9_-]{3,50}$',
-        'file_hash': r'^[a-f0-9]{64}$',  # SHA256
-        'filename': r'^[^<>:"/\\|?*]{1,255}$',
-        'ip_address': r'^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$',
-        'port': r'^(?:[0-9]{1,4}|[1-5][0-9]{4}|6[0-4][0-9]{3}|65[0-4][0-9]{2}|655[0-2][0-9]|6553[0-5])$',
-        'search_query': r'^[a-zA-Z0-9\s._-]{1,100}$'
-    }
-    
-    # Límites de validación
-    LIMITS = {
-        'max_filename_length': 255,
-        'max_search_query_length': 100,
-        'max_peer_id_length': 50,
-        'min_peer_id_length': 3,
-        'max_file_size_mb': 100,
-        'max_page_size': 100,
-        'min_page_size': 1,
-        'max_search_results': 1000
-    }
-    
-    @classmethod
-    def validate_peer_id(cls, peer_id: str) -> bool:
-        """Valida un ID de peer"""
-        if not peer_id or not isinstance(peer_id, str):
-            return False
-        
-        if not (cls.LIMITS['min_peer_id_length'] <= len(peer_id) <= cls.LIMITS['max_peer_id_length']):
-            return False
-        
-        return bool(re.match(cls.PATTERNS['peer_id'], peer_id))
-    
-    @classmethod
-    def validate_file_hash(cls, file_hash: str) -> bool:
-        """Valida un hash de archivo SHA256"""
-        if not file_hash or not isinstance(file_hash, str):
-            return False
-        
-        return bool(re.match(cls.PATTERNS['file_hash'], file_hash))
-    
-    @classmethod
-    def validate_filename(cls, filename: str) -> bool:
-        """Valida un nombre de archivo"""
-        if not filename or not isinstance(filename, str):
-            return False
-        
-        if len(filename) > cls.LIMITS['max_filename_length']:
-            return False
-        
-        # Verificar caracteres no permitidos
-        if not re.match(cls.PATTERNS['filename'], filename):
-            return False
-        
-        # Verificar que no sea solo puntos o espacios
-        if filename.strip('. ').strip() == '':
-            return False
-        
-        return True
-    
-    @classmethod
-    def validate_ip_address(cls, ip: str) -> bool:
-        """Valida una dirección IP"""
-        if not ip or not isinstance(ip, str):
-            return False
-        
-        try:
-            ipaddress.ip_address(ip)
-            return True
-        except ValueError:
-            return False
-    
-    @classmethod
-    def validate_port(cls, port: Union[int, str]) -> bool:
-        """Valida un puerto"""
-        try:
-            port_int = int(port)
-            return 1 <= port_int <= 65535
-        except (ValueError, TypeError):
-            return False
-    
-    @classmethod
-    def validate_search_query(cls, query: str) -> bool:
-        """Valida una consulta de búsqueda"""
-        if not query or not isinstance(query, str):
-            return False
-        
-        if len(query.strip()) < 1:
-            return False
-        
-        if len(query) > cls.LIMITS['max_search_query_length']:
-            return False
-        
-        # Verificar caracteres permitidos
-        return bool(re.match(cls.PATTERNS['search_query'], query.strip()))
-    
-    @classmethod
-    def validate_pagination(cls, page: int, limit: int) -> bool:
-        """Valida parámetros de paginación"""
-        if not isinstance(page, int) or not isinstance(limit, int):
-            return False
-        
-        if page < 1:
-            return False
-        
-        if not (cls.LIMITS['min_page_size'] <= limit <= cls.LIMITS['max_page_size']):
-            return False
-        
-        return True
-    
-    @classmethod
-    def validate_file_size(cls, size_bytes: int) -> bool:
-        """Valida el tamaño de un archivo"""
-        if not isinstance(size_bytes, int):
-            return False
-        
-        max_size_bytes = cls.LIMITS['max_file_size_mb'] * 1024 * 1024
-        return 0 < size_bytes <= max_size_bytes
-    
-    @classmethod
-    def sanitize_string(cls, text: str, max_length: int = 255) -> str:
-        """Sanitiza una cadena de texto"""
-        if not text or not isinstance(text, str):
-            return ""
-        
-        # Remover caracteres de control y espacios extra
-        sanitized = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text.strip())
-        
-        # Limitar longitud
-        if len(sanitized) > max_length:
-            sanitized = sanitized[:max_length]
-        
-        return sanitized
-    
-    @classmethod
-    def validate_peer_registration(cls, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Valida datos de registro de peer"""
-        errors = []
-        
-        # Validar peer_id
-        if 'peer_id' not in data or not cls.validate_peer_id(data['peer_id']):
-            errors.append("peer_id inválido")
-        
-        # Validar host
-        if 'host' not in data or not cls.validate_ip_address(data['host']):
-            errors.append("host inválido")
-        
-        # Validar puerto
-        if 'port' not in data or not cls.validate_port(data['port']):
-            errors.append("port inválido")
-        
-        # Validar puerto gRPC si existe
-        if 'grpc_port' in data and not cls.validate_port(data['grpc_port']):
-            errors.append("grpc_port inválido")
-        
-        # Validar shared_directory
-        if 'shared_directory' in data:
-            shared_dir = data['shared_directory']
-            if not isinstance(shared_dir, str) or len(shared_dir.strip()) == 0:
-                errors.append("shared_directory inválido")
-        
-        if errors:
-            raise ValidationError(f"Errores de validación: {', '.join(errors)}")
-        
-        return data
-    
-    @classmethod
-    def validate_search_request(cls, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Valida datos de búsqueda"""
-        errors = []
-        
-        # Validar query
-        if 'query' not in data or not cls.validate_search_query(data['query']):
-            errors.append("query de búsqueda inválida")
-        
-        # Validar paginación
-        page = data.get('page', 1)
-        limit = data.get('limit', 50)
-        
-        if not cls.validate_pagination(page, limit):
-            errors.append("parámetros de paginación inválidos")
-        
-        # Validar peer_id si existe
-        if 'peer_id' in data and data['peer_id'] and not cls.validate_peer_id(data['peer_id']):
-            errors.append("peer_id inválido")
-        
-        if errors:
-            raise ValidationError(f"Errores de validación: {', '.join(errors)}")
-        
-        return data
-    
-    @classmethod
-    def validate_download_request(cls, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Valida datos de descarga"""
-        errors = []
-        
-        # Validar file_hash
-        if 'file_hash' not in data or not cls.validate_file_hash(data['file_hash']):
-            errors.append("file_hash inválido")
-        
-        # Validar target_peer si existe
-        if 'target_peer' in data and data['target_peer'] and not cls.validate_peer_id(data['target_peer']):
-            errors.append("target_peer inválido")
-        
-        if errors:
-            raise ValidationError(f"Errores de validación: {', '.join(errors)}")
-        
-        return data
-
-# Instancia global del validador
-input_validator = InputValidator()
+"""
+Utilidades de validación de entrada para APIs
+"""
+
+import re
+import string
+import ipaddress
+from typing import Any, Dict, Iterator, List, Optional, Union
+from pydantic import BaseModel, validator
+import functools
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Caracteres de control eliminados por sanitize_string
+_CTRL_RE = re.compile(r'[\x00-\x1f\x7f-\x9f]')
+
+# Alfabetos permitidos: validar con operaciones de conjuntos en C, sin motor de regex
+_PEER_ID_CHARS = frozenset(string.ascii_letters + string.digits + '_-')
+_HEX_CHARS = frozenset('0123456789abcdef')
+_SEARCH_QUERY_CHARS = frozenset(string.ascii_letters + string.digits + '._-')
+
+class ValidationError(Exception):
+    """Excepción personalizada para errores de validación"""
+    pass
+
+class InputValidator:
+    """Validador de entradas para APIs"""
+    
+    # Patrones de validación (compilados una sola vez al definir la clase)
+    PATTERNS = {
+        'filename': re.compile(r'^[^<>:"/\\|?*]{1,255}$'),
+        'port': re.compile(r'^(?:[0-9]{1,4}|[1-5][0-9]{4}|6[0-4][0-9]{3}|65[0-4][0-9]{2}|655[0-2][0-9]|6553[0-5])$')
+    }
+    
+    # Límites de validación
+    LIMITS = {
+        'max_filename_length': 255,
+        'max_search_query_length': 100,
+        'max_peer_id_length': 50,
+        'min_peer_id_length': 3,
+        'max_file_size_mb': 100,
+        'max_page_size': 100,
+        'min_page_size': 1,
+        'max_search_results': 1000
+    }
+    # Límites derivados, calculados una sola vez a partir de LIMITS
+    _MAX_FILE_SIZE_BYTES = LIMITS['max_file_size_mb'] << 20
+    _MIN_PAGE_SIZE = LIMITS['min_page_size']
+    _MAX_PAGE_SIZE = LIMITS['max_page_size']
+    
+    @classmethod
+    def validate_peer_id(cls, peer_id: str) -> bool:
+        """Valida un ID de peer"""
+        if not peer_id or not isinstance(peer_id, str):
+            return False
+        
+        return _validate_peer_id_cached(peer_id)
+    
+    @classmethod
+    def validate_file_hash(cls, file_hash: str) -> bool:
+        """Valida un hash de archivo SHA256"""
+        if not file_hash or not isinstance(file_hash, str):
+            return False
+        
+        return _validate_file_hash_cached(file_hash)
+    
+    @classmethod
+    def validate_filename(cls, filename: str) -> bool:
+        """Valida un nombre de archivo"""
+        if not filename or not isinstance(filename, str):
+            return False
+        
+        if len(filename) > cls.LIMITS['max_filename_length']:
+            return False
+        
+        # Verificar caracteres no permitidos
+        if not cls.PATTERNS['filename'].match(filename):
+            return False
+        
+        # Verificar que no sea solo puntos o espacios
+        if filename.strip('. ').strip() == '':
+            return False
+        
+        return True
+    
+    @classmethod
+    def validate_ip_address(cls, ip: str) -> bool:
+        """Valida una dirección IP"""
+        if not ip or not isinstance(ip, str):
+            return False
+        
+        return _validate_ip_address_cached(ip)
+    
+    @classmethod
+    def validate_port(cls, port: Union[int, str]) -> bool:
+        """Valida un puerto"""
+        try:
+            port_int = int(port)
+            return 1 <= port_int <= 65535
+        except (ValueError, TypeError):
+            return False
+    
+    @classmethod
+    def validate_search_query(cls, query: str) -> bool:
+        """Valida una consulta de búsqueda"""
+        if not query or not isinstance(query, str):
+            return False
+        
+        if len(query.strip()) < 1:
+            return False
+        
+        if len(query) > cls.LIMITS['max_search_query_length']:
+            return False
+        
+        # Verificar caracteres permitidos: letras, dígitos, '._-' y espacios en blanco
+        extra = set(query.strip()).difference(_SEARCH_QUERY_CHARS)
+        return not extra or ''.join(extra).isspace()
+    
+    @classmethod
+    def validate_pagination(cls, page: int, limit: int) -> bool:
+        """Valida parámetros de paginación"""
+        if not isinstance(page, int) or not isinstance(limit, int):
+            return False
+        
+        if page < 1:
+            return False
+        
+        if not (cls._MIN_PAGE_SIZE <= limit <= cls._MAX_PAGE_SIZE):
+            return False
+        
+        return True
+    
+    @classmethod
+    def validate_file_size(cls, size_bytes: int) -> bool:
+        """Valida el tamaño de un archivo"""
+        if not isinstance(size_bytes, int):
+            return False
+        
+        return 0 < size_bytes <= cls._MAX_FILE_SIZE_BYTES
+    
+    @classmethod
+    def sanitize_string(cls, text: str, max_length: int = 255) -> str:
+        """Sanitiza una cadena de texto"""
+        if not text or not isinstance(text, str):
+            return ""
+        
+        # Remover caracteres de control y espacios extra
+        sanitized = _CTRL_RE.sub('', text.strip())
+        
+        # Limitar longitud
+        if len(sanitized) > max_length:
+            sanitized = sanitized[:max_length]
+        
+        return sanitized
+    
+    @classmethod
+    def cache_info(cls) -> Dict[str, Dict[str, int]]:
+        """Estadísticas de las cachés de validación (aciertos, fallos, tamaño)"""
+        return {
+            name: func.cache_info()._asdict()
+            for name, func in (
+                ('peer_id', _validate_peer_id_cached),
+                ('file_hash', _validate_file_hash_cached),
+                ('ip_address', _validate_ip_address_cached),
+            )
+        }
+    
+    @classmethod
+    def _check_errors(cls, errors: Iterator[str], fail_fast: bool) -> None:
+        """
+        Lanza ValidationError con los errores producidos por un generador de validaciones
+        
+        Con fail_fast se detiene en el primer error: las validaciones siguientes no se ejecutan
+        """
+        if fail_fast:
+            first_error = next(errors, None)
+            if first_error is not None:
+                raise ValidationError(f"Errores de validación: {first_error}")
+            return
+        
+        error_list = list(errors)
+        if error_list:
+            raise ValidationError(f"Errores de validación: {', '.join(error_list)}")
+    
+    @classmethod
+    def _peer_registration_errors(cls, data: Dict[str, Any]) -> Iterator[str]:
+        """Genera los errores de un registro de peer, de uno en uno"""
+        # Validar peer_id
+        if not cls.validate_peer_id(data.get('peer_id')):
+            yield "peer_id inválido"
+        
+        # Validar host
+        if not cls.validate_ip_address(data.get('host')):
+            yield "host inválido"
+        
+        # Validar puerto
+        if not cls.validate_port(data.get('port')):
+            yield "port inválido"
+        
+        # Validar puerto gRPC si existe
+        grpc_port = data.get('grpc_port')
+        if grpc_port is not None and not cls.validate_port(grpc_port):
+            yield "grpc_port inválido"
+        
+        # Validar shared_directory
+        shared_dir = data.get('shared_directory')
+        if shared_dir is not None and (not isinstance(shared_dir, str) or len(shared_dir.strip()) == 0):
+            yield "shared_directory inválido"
+    
+    @classmethod
+    def validate_peer_registration(cls, data: Dict[str, Any], fail_fast: bool = True) -> Dict[str, Any]:
+        """Valida datos de registro de peer (por defecto se detiene en el primer error)"""
+        cls._check_errors(cls._peer_registration_errors(data), fail_fast)
+        return data
+    
+    @classmethod
+    def validate_peer_registration_verbose(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Valida datos de registro de peer informando todos los errores"""
+        return cls.validate_peer_registration(data, fail_fast=False)
+    
+    @classmethod
+    def _search_request_errors(cls, data: Dict[str, Any]) -> Iterator[str]:
+        """Genera los errores de una búsqueda, de uno en uno"""
+        # Validar query
+        if not cls.validate_search_query(data.get('query')):
+            yield "query de búsqueda inválida"
+        
+        # Validar paginación
+        if not cls.validate_pagination(data.get('page', 1), data.get('limit', 50)):
+            yield "parámetros de paginación inválidos"
+        
+        # Validar peer_id si existe
+        peer_id = data.get('peer_id')
+        if peer_id and not cls.validate_peer_id(peer_id):
+            yield "peer_id inválido"
+    
+    @classmethod
+    def validate_search_request(cls, data: Dict[str, Any], fail_fast: bool = True) -> Dict[str, Any]:
+        """Valida datos de búsqueda (por defecto se detiene en el primer error)"""
+        cls._check_errors(cls._search_request_errors(data), fail_fast)
+        return data
+    
+    @classmethod
+    def _download_request_errors(cls, data: Dict[str, Any]) -> Iterator[str]:
+        """Genera los errores de una descarga, de uno en uno"""
+        # Validar file_hash
+        if not cls.validate_file_hash(data.get('file_hash')):
+            yield "file_hash inválido"
+        
+        # Validar target_peer si existe
+        target_peer = data.get('target_peer')
+        if target_peer and not cls.validate_peer_id(target_peer):
+            yield "target_peer inválido"
+    
+    @classmethod
+    def validate_download_request(cls, data: Dict[str, Any], fail_fast: bool = True) -> Dict[str, Any]:
+        """Valida datos de descarga (por defecto se detiene en el primer error)"""
+        cls._check_errors(cls._download_request_errors(data), fail_fast)
+        return data
+
+# Validaciones memorizadas: los mismos peer_id, hashes y hosts se repiten entre peticiones.
+# Solo reciben str (hashables); los tipos se comprueban antes en InputValidator
+VALIDATION_CACHE_SIZE = 4096
+
+@functools.lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _validate_peer_id_cached(peer_id: str) -> bool:
+    limits = InputValidator.LIMITS
+    if not (limits['min_peer_id_length'] <= len(peer_id) <= limits['max_peer_id_length']):
+        return False
+    return _PEER_ID_CHARS.issuperset(peer_id)
+
+@functools.lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _validate_file_hash_cached(file_hash: str) -> bool:
+    return len(file_hash) == 64 and _HEX_CHARS.issuperset(file_hash)
+
+@functools.lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _validate_ip_address_cached(ip: str) -> bool:
+    try:
+        ipaddress.ip_address(ip)
+        return True
+    except ValueError:
+        return False
+
+# Instancia global del validador
+input_validator = InputValidator()
@@ -1 +1 @@
-# Paquete del peer P2P
+# Paquete del peer P2P
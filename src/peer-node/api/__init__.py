@@ -1 +1 @@
-# APIs del peer
+# APIs del peer
@@ -1 +1 @@
-# Modelos de datos del peer
+# Modelos de datos del peer
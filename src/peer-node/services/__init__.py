@@ -1 +1 @@
-# Servicios del peer
+# Servicios del peer
@@ -1,93 +1,162 @@
-import os
-import asyncio
-from typing import List, Dict, Optional
-from datetime import datetime
-from models.file_info import FileInfo
-
-class FileIndexer:
-    """Servicio de indexación de archivos locales"""
-    
-    def __init__(self, shared_directory: str, peer_id: str):
-        self.shared_directory = shared_directory
-        self.peer_id = peer_id
-        self.file_index: Dict[str, FileInfo] = {}
-        self._lock = asyncio.Lock()
-    
-    async def scan_directory(self) -> List[FileInfo]:
-        """Escanea el directorio compartido y actualiza el índice"""
-        async with self._lock:
-            files = []
-            try:
-                for root, dirs, filenames in os.walk(self.shared_directory):
-                    for filename in filenames:
-                        file_path = os.path.join(root, filename)
-                        try:
-                            file_info = FileInfo.from_file(file_path, self.peer_id)
-                            files.append(file_info)
-                            self.file_index[file_info.hash] = file_info
-                        except Exception as e:
-                            print(f"Error indexando archivo {file_path}: {e}")
-                            continue
-            except Exception as e:
-                print(f"Error escaneando directorio {self.shared_directory}: {e}")
-            
-            return files
-    
-    async def get_file_by_hash(self, file_hash: str) -> Optional[FileInfo]:
-        """Obtiene información de un archivo por su hash"""
-        async with self._lock:
-            return self.file_index.get(file_hash)
-    
-    async def search_files(self, filename: Optional[str] = None, 
-                          file_hash: Optional[str] = None,
-                          min_size: Optional[int] = None,
-                          max_size: Optional[int] = None) -> List[FileInfo]:
-        """Busca archivos en el índice local"""
-        async with self._lock:
-            results = []
-            
-            for file_info in self.file_index.values():
-                # Filtro por nombre
-                if filename and filename.lower() not in file_info.filename.lower():
-                    continue
-                
-                # Filtro por hash
-                if file_hash and file_info.hash != file_hash:
-                    continue
-                
-                # Filtro por tamaño
-                if min_size and file_info.size < min_size:
-                    continue
-                
-                if max_size and file_info.size > max_size:
-                    continue
-                
-                results.append(file_info)
-            
-            return results
-    
-    async def add_file(self, file_info: FileInfo) -> None:
-        """Añade un archivo al índice"""
-        async with self._lock:
-            self.file_index[file_info.hash] = file_info
-    
-    async def remove_file(self, file_hash: str) -> bool:
-        """Elimina un archivo del índice"""
-        async with self._lock:
-            if file_hash in self.file_index:
-                del self.file_index[file_hash]
-                return True
-            return False
-    
-    async def get_all_files(self) -> List[FileInfo]:
-        """Obtiene todos los archivos del índice"""
-        async with self._lock:
-            return list(self.file_index.values())
-    
-    async def update_file_availability(self, file_hash: str, is_available: bool) -> bool:
-        """Actualiza la disponibilidad de un archivo"""
-        async with self._lock:
-            if file_hash in self.file_index:
-                self.file_index[file_hash].is_available = is_available
-                return True
-            return False
+import os
+import asyncio
+import hashlib
+from typing import List, Dict, Optional
+from datetime import datetime
+from models.file_info import FileInfo
+
+class FileIndexer:
+    """Servicio de indexación de archivos locales"""
+    
+    def __init__(self, shared_directory: str, peer_id: str):
+        self.shared_directory = shared_directory
+        self.peer_id = peer_id
+        self.file_index: Dict[str, FileInfo] = {}
+        self._lock = asyncio.Lock()
+        self._etag: Optional[str] = None
+        # Agregados del índice mantenidos en cada escritura, para no recorrerlo en cada consulta
+        self._total_size = 0
+        self._available_count = 0
+    
+    def _index_put(self, file_info: FileInfo) -> None:
+        """Inserta o reemplaza una entrada del índice actualizando los agregados (requiere el lock)"""
+        self._index_pop(file_info.hash)
+        self.file_index[file_info.hash] = file_info
+        self._total_size += file_info.size
+        if file_info.is_available:
+            self._available_count += 1
+    
+    def _index_pop(self, file_hash: str) -> Optional[FileInfo]:
+        """Quita una entrada del índice actualizando los agregados (requiere el lock)"""
+        file_info = self.file_index.pop(file_hash, None)
+        if file_info is not None:
+            self._total_size -= file_info.size
+            if file_info.is_available:
+                self._available_count -= 1
+        return file_info
+    
+    async def scan_directory(self) -> List[FileInfo]:
+        """Escanea el directorio compartido y actualiza el índice"""
+        async with self._lock:
+            self._etag = None
+            files = []
+            # Entradas ya indexadas por ruta: si el tamaño y la fecha de modificación no cambiaron,
+            # se reutilizan sin volver a leer ni hashear el archivo
+            indexed_by_path = {f.path: f for f in self.file_index.values()}
+            try:
+                for root, dirs, filenames in os.walk(self.shared_directory):
+                    for filename in filenames:
+                        file_path = os.path.join(root, filename)
+                        try:
+                            file_info = indexed_by_path.get(file_path)
+                            stat = os.stat(file_path)
+                            if (file_info is None or file_info.size != stat.st_size or
+                                    file_info.last_modified != datetime.fromtimestamp(stat.st_mtime)):
+                                file_info = FileInfo.from_file(file_path, self.peer_id)
+                            elif not file_info.is_available:
+                                # Presente en disco: vuelve a estar disponible, como al reconstruir la entrada.
+                                # Copia nueva para que _index_put descuente la entrada vieja con su estado original
+                                file_info = file_info.model_copy(update={'is_available': True})
+                            files.append(file_info)
+                            self._index_put(file_info)
+                        except Exception as e:
+                            print(f"Error indexando archivo {file_path}: {e}")
+                            continue
+            except Exception as e:
+                print(f"Error escaneando directorio {self.shared_directory}: {e}")
+            
+            return files
+    
+    async def get_file_by_hash(self, file_hash: str) -> Optional[FileInfo]:
+        """Obtiene información de un archivo por su hash"""
+        async with self._lock:
+            return self.file_index.get(file_hash)
+    
+    async def search_files(self, filename: Optional[str] = None, 
+                          file_hash: Optional[str] = None,
+                          min_size: Optional[int] = None,
+                          max_size: Optional[int] = None) -> List[FileInfo]:
+        """Busca archivos en el índice local"""
+        async with self._lock:
+            results = []
+            
+            for file_info in self.file_index.values():
+                # Filtro por nombre
+                if filename and filename.lower() not in file_info.filename.lower():
+                    continue
+                
+                # Filtro por hash
+                if file_hash and file_info.hash != file_hash:
+                    continue
+                
+                # Filtro por tamaño
+                if min_size and file_info.size < min_size:
+                    continue
+                
+                if max_size and file_info.size > max_size:
+                    continue
+                
+                results.append(file_info)
+            
+            return results
+    
+    async def add_file(self, file_info: FileInfo) -> None:
+        """Añade un archivo al índice"""
+        async with self._lock:
+            self._index_put(file_info)
+            self._etag = None
+    
+    async def remove_file(self, file_hash: str) -> bool:
+        """Elimina un archivo del índice"""
+        async with self._lock:
+            if self._index_pop(file_hash) is not None:
+                self._etag = None
+                return True
+            return False
+    
+    async def clear(self) -> None:
+        """Vacía el índice"""
+        async with self._lock:
+            self.file_index.clear()
+            self._total_size = 0
+            self._available_count = 0
+            self._etag = None
+    
+    async def get_stats(self) -> Dict[str, int]:
+        """Obtiene totales del índice (precalculados, sin recorrer los archivos)"""
+        async with self._lock:
+            return {
+                "total_files": len(self.file_index),
+                "total_size": self._total_size,
+                "available_files": self._available_count
+            }
+    
+    async def get_all_files(self) -> List[FileInfo]:
+        """Obtiene todos los archivos del índice"""
+        async with self._lock:
+            return list(self.file_index.values())
+    
+    async def get_etag(self) -> str:
+        """Obtiene un ETag del índice actual, recalculado solo cuando el índice cambia"""
+        async with self._lock:
+            if self._etag is None:
+                digest = hashlib.sha256()
+                for file_info in sorted(self.file_index.values(), key=lambda f: f.hash):
+                    digest.update(
+                        f"{file_info.hash}:{file_info.filename}:{file_info.size}:"
+                        f"{file_info.last_modified.isoformat()}:{file_info.is_available}\n".encode()
+                    )
+                self._etag = f'"{digest.hexdigest()[:32]}"'
+            return self._etag
+    
+    async def update_file_availability(self, file_hash: str, is_available: bool) -> bool:
+        """Actualiza la disponibilidad de un archivo"""
+        async with self._lock:
+            file_info = self.file_index.get(file_hash)
+            if file_info is not None:
+                if file_info.is_available != is_available:
+                    self._available_count += 1 if is_available else -1
+                file_info.is_available = is_available
+                self._etag = None
+                return True
+            return False
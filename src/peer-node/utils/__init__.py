@@ -1 +1 @@
-# Utilidades del peer
+# Utilidades del peer